@@ -0,0 +1,196 @@
+"""
+Measure deck generation: cards/s, pages/s, peak memory and output size for every engine.
+
+Every run generates a synthetic deck (markup, long translations that wrap, extras and indices) in a fresh interpreter, so the
+peak RSS is that of the run alone. Where ``/proc`` is available, the RSS of the worker processes is sampled and added to it
+(pages the workers share with the main process are counted for each of them); elsewhere the peak is that of the largest
+process. Prints the results as JSON, e.g.::
+
+    python benchmarks/generate.py --cards 100 1000 10000 > before.json
+    python benchmarks/generate.py --cards 100 1000 10000 --compare before.json > after.json
+
+``--compare`` prints the change against an earlier result file to stderr.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+CARDS = [100, 1_000, 10_000, 100_000, 1_000_000]
+PAGE_SIZE = resource.getpagesize()
+
+# Name -> how the generator is set up and which method renders the deck
+CONFIGURATIONS = {
+    "platypus": {"engine": "platypus"},
+    "canvas": {"engine": "canvas"},
+    "canvas-stream": {"engine": "canvas", "stream": True},
+    "canvas-parallel": {"engine": "canvas", "workers": os.cpu_count() or 1},
+    "canvas-fast": {"engine": "canvas", "profile": "fast"},
+    "canvas-compact": {"engine": "canvas", "profile": "compact"},
+}
+
+WORDS = ["amicus", "deus", "dominus", "equus", "filius", "servus", "aqua", "familia", "via", "monumentum", "templum", "vinum"]
+TRANSLATIONS = ["de vriend", "de god", "de meester", "het paard", "de zoon", "de slaaf", "het water", "het gezin", "de weg", "het aandenken"]
+
+
+def synthetic_deck(cards: int, seed: int = 0) -> Iterator[tuple[str, str, str, str]]:
+    """Yield ``cards`` cards (as add_entry arguments) with markup, wrapping translations, extras and indices."""
+    rng = random.Random(seed)
+    for index in range(1, cards + 1):
+        original = rng.choice(WORDS)
+        if rng.random() < 0.5:
+            original = f"**{original}**"
+        translation = ", ".join(rng.choices(TRANSLATIONS, k=rng.choice([1, 1, 2, 6])))  # Some wrap over several lines
+        if rng.random() < 0.2:
+            translation += "<br/>*(figuurlijk)* __ook__"
+        extra = f"*{rng.choice(WORDS)}, {rng.choice('mvo')}*" if rng.random() < 0.8 else ""
+        yield original, translation, extra, str(index)
+
+
+class RssSampler(threading.Thread):
+    """Samples the total RSS of this process and its children from ``/proc``, keeping the peak; 0 where there is no ``/proc``."""
+
+    def __init__(self, interval: float = 0.02):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = 0
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            total = self.total()
+            if total is None:
+                return
+            self.peak = max(self.peak, total)
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+    @staticmethod
+    def total() -> int | None:
+        """The RSS of this process and its (direct) children, in bytes; None without ``/proc``."""
+        try:
+            pids = [os.getpid()]
+            for children in Path("/proc/self/task").glob("*/children"):
+                pids.extend(int(pid) for pid in children.read_text().split())
+        except OSError:
+            return None
+
+        total = 0
+        for pid in pids:
+            with contextlib.suppress(OSError, IndexError):  # The process ended in the meantime
+                total += int(Path(f"/proc/{pid}/statm").read_text().split()[1]) * PAGE_SIZE
+        return total
+
+
+def run(configuration: str, cards: int) -> dict:
+    """Generate one deck in this interpreter and measure it."""
+    from flashcard_generator import FlashCard, FlashCardGenerator
+    from flashcard_generator.merge import parse_pdf
+
+    settings = CONFIGURATIONS[configuration]
+    with tempfile.TemporaryDirectory() as directory:
+        fcg = FlashCardGenerator().set_filename(Path(directory) / "deck.pdf").set_engine(settings["engine"]).set_profile(settings.get("profile", "default"))
+        if settings.get("workers", 1) > 1:
+            fcg.set_workers(settings["workers"])
+
+        sampler = RssSampler()
+        sampler.start()
+        start = time.perf_counter()
+        if settings.get("stream"):
+            fcg.generate_stream(FlashCard(*card) for card in synthetic_deck(cards))
+        else:
+            for card in synthetic_deck(cards):
+                fcg.add_entry(*card)
+            fcg.generate()
+        seconds = time.perf_counter() - start
+        sampler.stop()
+
+        # ru_maxrss is in KiB on Linux and in bytes on macOS
+        scale = 1 if sys.platform == "darwin" else 1024
+        largest = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss) * scale
+        peak_rss = max(largest, sampler.peak)
+
+        output = fcg.filename.read_bytes()
+        pages, _ = parse_pdf(output).page_tree()
+
+    return {
+        "configuration": configuration,
+        "cards": cards,
+        "seconds": seconds,
+        "cards_per_s": cards / seconds,
+        "pages": len(pages),
+        "pages_per_s": len(pages) / seconds,
+        "peak_rss_bytes": peak_rss,
+        "output_bytes": len(output),
+    }
+
+
+def run_isolated(configuration: str, cards: int) -> dict:
+    output = subprocess.check_output([sys.executable, __file__, "--run", configuration, str(cards)], text=True)
+    return json.loads(output)
+
+
+def current_commit() -> str | None:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=Path(__file__).parent, text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: list[dict], baseline: list[dict]) -> None:
+    """Print how every measurement changed against the same one in ``baseline``."""
+    earlier = {(result["configuration"], result["cards"]): result for result in baseline}
+    for result in results:
+        before = earlier.get((result["configuration"], result["cards"]))
+        if before is None:
+            continue
+        changes = ", ".join(f"{key} {result[key] / before[key] - 1:+.1%}" for key in ("cards_per_s", "peak_rss_bytes", "output_bytes") if before[key])
+        print(f"{result['configuration']:>16} {result['cards']:>9} cards: {changes}", file=sys.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cards", type=int, nargs="+", default=CARDS, help="deck sizes to generate")
+    parser.add_argument("--configurations", nargs="+", choices=CONFIGURATIONS, default=list(CONFIGURATIONS), help="what to measure")
+    parser.add_argument("--compare", type=Path, help="an earlier result file to compare with")
+    parser.add_argument("--run", nargs=2, metavar=("CONFIGURATION", "CARDS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        json.dump(run(args.run[0], int(args.run[1])), sys.stdout)
+        return
+
+    results = []
+    for cards in args.cards:
+        for configuration in args.configurations:
+            results.append(run_isolated(configuration, cards))
+            print(f"{configuration:>16} {cards:>9} cards: {results[-1]['cards_per_s']:.0f} cards/s", file=sys.stderr)
+
+    if args.compare:
+        compare(results, json.loads(args.compare.read_text())["results"])
+
+    report = {"commit": current_commit(), "python": platform.python_version(), "platform": platform.platform(), "results": results}
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Measure the startup cost of flashcard_generator: importing the package, importing the generator and loading the fonts.
+
+Every measurement runs in a fresh interpreter. Prints the results as JSON, e.g.::
+
+    python benchmarks/import_time.py --repeat 20 > import_time.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+SNIPPETS = {
+    "import package": "import flashcard_generator",
+    "import generator": "from flashcard_generator import FlashCardGenerator",
+    "load fonts": "from flashcard_generator.fonts import DEFAULT_FONTS; DEFAULT_FONTS.load()",
+}
+
+
+def time_snippet(code: str, repeat: int) -> list[float]:
+    program = f"import time\nstart = time.perf_counter()\n{code}\nprint(time.perf_counter() - start)"
+    return [float(subprocess.check_output([sys.executable, "-c", program], text=True)) for _ in range(repeat)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="number of fresh interpreters per measurement")
+    args = parser.parse_args()
+
+    results = {}
+    for name, code in SNIPPETS.items():
+        timings = time_snippet(code, args.repeat)
+        results[name] = {"median_s": statistics.median(timings), "min_s": min(timings), "runs": len(timings)}
+
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
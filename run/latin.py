@@ -1,71 +1,5 @@
-from flashcard_generator import FlashCardGenerator
+from pathlib import Path
 
-FlashCardGenerator().set_filename("Latin.pdf").add_entry(original="amicus", translation="de vriend", extra="*amici, m *", index="1").add_entry(
-    original="deus", translation="de god", extra="*dei, m*", index="2"
-).add_entry(original="dominus", translation="de meester", extra="*domini, m*", index="3").add_entry(
-    original="equus", translation="het paard", extra="*equi, m*", index="4"
-).add_entry(original="filius", translation="de zoon", extra="*filii, m*", index="5").add_entry(
-    original="servus", translation="de slaaf", extra="*servi, m*", index="6"
-).add_entry(original="aqua", translation="het water", extra="*aquae, v*", index="7").add_entry(
-    original="familia", translation="het gezin, het personeel", extra="*familiae, v*", index="8"
-).add_entry(original="via", translation="de weg ", extra="*viae, v*", index="9").add_entry(
-    original="monumentum", translation="het monument, het aandenken", extra="*monumenti, o*", index="10"
-).add_entry(original="templum", translation="de tempel", extra="*templi, o*", index="11").add_entry(
-    original="vinum", translation="de wijn", extra="*vini, o*", index="12"
-).add_entry(original="pater", translation="de vader", extra="*patr-is, m*", index="13").add_entry(
-    original="senex", translation="de oude man", extra="*sen-is, m*", index="14"
-).add_entry(original="virgo", translation="de maagd, het meisje", extra="*virgin-is, v*", index="15").add_entry(
-    original="vox", translation="de stem, het woord", extra="*voc-is, v*", index="16"
-).add_entry(original="flumen", translation="de rivier", extra="*flumin-is, o*", index="17").add_entry(
-    original="sidus", translation="de ster", extra="*sider-is, o*", index="18"
-).add_entry(original="amica", translation="de vriendin", extra="*amicae, v*", index="p3").add_entry(
-    original="dea", translation="de godin", extra="*deae, v*", index="p3"
-).add_entry(original="domina", translation="de meesteres", extra="*dominae, v*", index="p3").add_entry(
-    original="filia", translation="de dochter", extra="*filiae, v*", index="p3"
-).add_entry(original="serva", translation="de slavin", extra="*servae, v*", index="p3").add_entry(
-    original="femina", translation="de vrouw", extra="*feminae, v*", index="19"
-).add_entry(original="canis", translation="de hond", extra="*can-is, m*", index="20").add_entry(
-    original="iuvenis", translation="de jongeman", extra="*iuven-is, m*", index="21"
-).add_entry(original="mercator", translation="de handelaar", extra="*mercator-is, m*", index="22").add_entry(
-    original="miles", translation="de soldaat", extra="*milit-is, m*", index="23"
-).add_entry(original="senator", translation="de senator", extra="*senator-is, m*", index="24").add_entry(
-    original="nox", translation="de nacht", extra="*noct-is, v*", index="25"
-).add_entry(original="caput", translation="het hoofd, het hoofdstuk", extra="*capit-is*", index="26").add_entry(
-    original="est", translation="(hij, zij, het, er) is", extra="*(werkwoord)*", index="27"
-).add_entry(original="sunt", translation="(zij, er) zijn", extra="*(werkwoord)*", index="28").add_entry(
-    original="ibi", translation="daar", extra="*(bijwoord)*", index="29"
-).add_entry(original="saepe", translation="dikwijls", extra="*(bijwoord)*", index="30").add_entry(
-    original="aut", translation="of", extra="*(voegwoord)*", index="31"
-).add_entry(original="et", translation="en, ook", extra="*(voegwoord)*", index="32").add_entry(
-    original="-que", translation="en", extra="*(voegwoord)*", index="33"
-).add_entry(original="sed", translation="maar", extra="*(voegwoord)*", index="34").add_entry(
-    original="avus", translation="de grootvader", extra="*avi, m*", index="35"
-).add_entry(original="rosa", translation="de roos", extra="*rosae, v*", index="36").add_entry(
-    original="donum", translation="het geschenk", extra="*doni, o*", index="37"
-).add_entry(original="dux", translation="de leider", extra="*duc-is, m*", index="38").add_entry(
-    original="mater", translation="de moeder", extra="*matr-is, v*", index="39"
-).add_entry(original="corpus", translation="het lichaam", extra="*corpor-is, o*", index="40").add_entry(
-    original="iam", translation="al, dadelijk", extra="*(bijwoord)*", index="41"
-).add_entry(original="interdum", translation="soms", extra="*(bijwoord)*", index="42").add_entry(
-    original="quoque", translation="ook", extra="*(bijwoord)*", index="43"
-).add_entry(original="enim", translation="want", extra="*(voegwoord)*", index="44").add_entry(
-    original="curia", translation="de curia (Romeinse senaatsgebouw)", extra="*curiae, v*", index="45"
-).add_entry(original="fabula", translation="het verhaal, het toneelstuk", extra="*fabulae, v*", index="46").add_entry(
-    original="luna", translation="de maan", extra="*lunae, v*", index="47"
-).add_entry(original="forum", translation="het forum (Romeinse marktplein)", extra="*fori, o*", index="48").add_entry(
-    original="iudex", translation="de rechter", extra="*iudic-is, m*", index="49"
-).add_entry(original="onus", translation="de last", extra="*oner-is, o*", index="50").add_entry(
-    original="tempus", translation="de tijd, het moment", extra="*tempor-is, o*", index="51"
-).add_entry(original="non", translation="niet", extra="*(ontkenning)*", index="52").add_entry(
-    original="semper", translation="altijd", extra="*(bijwoord)*", index="53"
-).add_entry(original="statua", translation="het standbeeld", extra="*statuae, v*", index="54").add_entry(
-    original="eques", translation="de ruiter, de ridder", extra="*equit-is, m*", index="55"
-).add_entry(original="laborare", translation="werken, lijden", extra="*laboro*", index="56").add_entry(
-    original="apparere", translation="verschijnen, blijken", extra="*appareo*", index="57"
-).add_entry(original="dormire", translation="slapen", extra="*dormio*", index="58").add_entry(
-    original="domi", translation="thuis", extra="*(bijwoord)*", index="59"
-).add_entry(original="etiam", translation="ook, zelfs", extra="*(bijwoord)*", index="60").add_entry(
-    original="nondum", translation="nog niet", extra="*(bijwoord)*", index="61"
-).add_entry(original="non iam", translation="niet meer", extra="*(bijwoord)*", index="62").add_entry(
-    original="nunc", translation="nu", extra="*(bijwoord)*", index="63"
-).generate()
+from flashcard_generator import FlashCardGenerator, read_csv
+
+FlashCardGenerator().set_filename("Latin.pdf").add_entries(read_csv(Path(__file__).with_name("latin.csv"))).generate()
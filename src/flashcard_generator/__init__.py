@@ -1,3 +1,69 @@
-from .generator import FlashCard, FlashCardGenerator
+from __future__ import annotations
 
-__all__ = ["FlashCard", "FlashCardGenerator"]
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .batch import DeckJob, DeckResult, build_decks, find_decks, read_manifest
+    from .deck import CardView, FlashCardDeck
+    from .fonts import FontSet
+    from .generator import FlashCard, FlashCardGenerator
+    from .indexed import CardRange, IndexedSource
+    from .loaders import read_csv, read_entries, read_jsonl, read_tsv
+    from .preflight import CardReport, PreflightReport
+    from .stats import GenerationStats
+
+__all__ = [
+    "CardRange",
+    "CardReport",
+    "CardView",
+    "DeckJob",
+    "DeckResult",
+    "FlashCard",
+    "FlashCardDeck",
+    "FlashCardGenerator",
+    "FontSet",
+    "GenerationStats",
+    "IndexedSource",
+    "PreflightReport",
+    "build_decks",
+    "find_decks",
+    "read_csv",
+    "read_entries",
+    "read_jsonl",
+    "read_manifest",
+    "read_tsv",
+]
+
+# Importing the package stays cheap: reportlab only gets imported once one of these is used.
+_EXPORTS = {
+    "CardRange": ".indexed",
+    "CardReport": ".preflight",
+    "CardView": ".deck",
+    "DeckJob": ".batch",
+    "DeckResult": ".batch",
+    "FlashCard": ".generator",
+    "FlashCardDeck": ".deck",
+    "FlashCardGenerator": ".generator",
+    "FontSet": ".fonts",
+    "GenerationStats": ".stats",
+    "IndexedSource": ".indexed",
+    "PreflightReport": ".preflight",
+    "build_decks": ".batch",
+    "find_decks": ".batch",
+    "read_csv": ".loaders",
+    "read_entries": ".loaders",
+    "read_jsonl": ".loaders",
+    "read_manifest": ".batch",
+    "read_tsv": ".loaders",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_EXPORTS[name], __name__), name)
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
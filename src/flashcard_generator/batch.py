@@ -0,0 +1,226 @@
+"""
+Build many decks at once, from a directory of deck files or a manifest.
+
+Decks are built on a pool of worker processes. Every worker registers the fonts once and keeps its measurement and
+layout caches for all the decks it builds, instead of starting cold for every deck. From the command line::
+
+    python -m flashcard_generator.batch decks/ --output build/ --workers 4 --engine canvas
+    python -m flashcard_generator.batch decks.json
+
+A manifest is a JSON file (paths are relative to it)::
+
+    {
+        "output": "build",
+        "options": {"engine": "canvas", "profile": "compact"},
+        "decks": [
+            "latin.csv",
+            {"source": "greek.jsonl", "output": "greek-a6.pdf", "options": {"cards_per_row": 3}, "loader": {"keys": {"original": "word"}}}
+        ]
+    }
+
+``options`` name generator setters (``engine`` calls ``set_engine()``): a value is passed as the only argument (``forms``
+as ``set_forms(enabled=...)``), a list as the arguments and an object as keyword arguments. A ``cache`` directory is
+relative to the manifest too. ``filename`` isn't an option: a deck's output is. ``loader`` holds the options of
+``read_entries()``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .fonts import DEFAULT_FONTS
+from .generator import ENGINES, PROFILES, FlashCardGenerator
+from .loaders import DECK_SUFFIXES, read_entries
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+
+# Setters whose only argument is keyword-only, with the keyword a single value is passed as
+_KEYWORD_OPTIONS = {"forms": "enabled"}
+
+
+@dataclass(frozen=True)
+class DeckJob:
+    """A deck to build: where its cards come from, where the PDF goes and how the generator is set up."""
+
+    source: Path
+    output: Path
+    options: Mapping[str, Any] = field(default_factory=dict)  # Setter name -> argument(s), see the module documentation
+    loader: Mapping[str, Any] = field(default_factory=dict)  # Options of read_entries()
+
+
+@dataclass(frozen=True)
+class DeckResult:
+    """How building a deck went."""
+
+    job: DeckJob
+    seconds: float
+    cards: int = 0
+    pages: int = 0
+    output_bytes: int = 0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def find_decks(directory: str | Path, output: str | Path | None = None, **options: Any) -> list[DeckJob]:
+    """A job for every deck file in ``directory``, building ``<name>.pdf`` in ``output`` (by default next to the deck)."""
+    directory = Path(directory)
+    output = directory if output is None else Path(output)
+    return [
+        DeckJob(source, output / source.with_suffix(".pdf").name, options)
+        for source in sorted(directory.iterdir())
+        if source.suffix.lower() in DECK_SUFFIXES and source.is_file()
+    ]
+
+
+def read_manifest(manifest: str | Path, output: str | Path | None = None, **options: Any) -> list[DeckJob]:
+    """
+    The jobs in a manifest file; see the module documentation for its format.
+
+    ``output`` replaces the manifest's output directory, and ``options`` are added to its options for all decks; the options
+    of a single deck still come first.
+    """
+    manifest = Path(manifest)
+    content = json.loads(manifest.read_text(encoding="utf-8"))
+    base = manifest.parent
+    output = base / content.get("output", ".") if output is None else Path(output)
+    defaults = {**_relative_to(base, content.get("options", {})), **options}
+
+    jobs = []
+    for deck in content["decks"]:
+        if isinstance(deck, str):
+            deck = {"source": deck}
+        source = base / deck["source"]
+        target = output / deck["output"] if "output" in deck else output / source.with_suffix(".pdf").name
+        jobs.append(DeckJob(source, target, {**defaults, **_relative_to(base, deck.get("options", {}))}, deck.get("loader", {})))
+    return jobs
+
+
+def _relative_to(base: Path, options: Mapping[str, Any]) -> dict[str, Any]:
+    """The manifest ``options`` with the cache directory taken relative to ``base``, like the decks."""
+    options = dict(options)
+    cache = options.get("cache")
+    if isinstance(cache, str):
+        options["cache"] = base / cache
+    elif isinstance(cache, list) and cache and isinstance(cache[0], str):
+        options["cache"] = [base / cache[0], *cache[1:]]
+    elif isinstance(cache, dict) and isinstance(cache.get("directory"), str):
+        options["cache"] = {**cache, "directory": base / cache["directory"]}
+    return options
+
+
+def build_decks(jobs: Iterable[DeckJob], *, workers: int | None = None) -> Iterator[DeckResult]:
+    """
+    Build every deck on ``workers`` processes (as many as there are CPUs if None), yielding the results in order.
+
+    A deck that fails doesn't stop the others: its result holds the error instead.
+    """
+    jobs = list(jobs)
+    if workers == 1 or len(jobs) <= 1:
+        yield from map(build_deck, jobs)
+        return
+
+    with ProcessPoolExecutor(workers, initializer=DEFAULT_FONTS.load) as pool:
+        yield from pool.map(build_deck, jobs)
+
+
+def build_deck(job: DeckJob) -> DeckResult:
+    """Build a single deck, streaming its cards from the source."""
+    start = time.perf_counter()
+    cards = 0
+
+    def counted(entries: Iterable) -> Iterator:
+        nonlocal cards
+        for entry in entries:
+            cards += 1
+            yield entry
+
+    # Rendered next to the output and moved in place, so a deck that fails keeps its last good PDF
+    temporary = job.output.with_name(f".{job.output.name}.{os.getpid()}.tmp")
+    try:
+        fcg = FlashCardGenerator().set_filename(temporary)
+        for name, value in job.options.items():
+            _configure(fcg, name, value)
+        job.output.parent.mkdir(parents=True, exist_ok=True)
+        stats = fcg.generate_stream(counted(read_entries(job.source, **job.loader)), stats=True)
+        temporary.replace(job.output)
+    except Exception as error:  # Reported in the summary; the other decks go on
+        temporary.unlink(missing_ok=True)
+        return DeckResult(job, time.perf_counter() - start, cards, error=f"{type(error).__name__}: {error}")
+
+    return DeckResult(job, time.perf_counter() - start, cards, stats.pages, stats.output_bytes)
+
+
+def format_summary(results: Sequence[DeckResult], seconds: float | None = None) -> str:
+    """A line per deck with its timing (or error), and a total."""
+    lines = []
+    for result in results:
+        if result.ok:
+            lines.append(
+                f"ok     {result.seconds:7.2f}s {result.cards:>8} cards {result.pages:>6} pages {result.output_bytes / 1024:>9.1f} KiB  {result.job.output}"
+            )
+        else:
+            lines.append(f"FAILED {result.seconds:7.2f}s  {result.job.source}: {result.error}")
+
+    failed = sum(not result.ok for result in results)
+    total = f"{len(results) - failed} decks built, {failed} failed"
+    if seconds is not None:
+        total += f" in {seconds:.2f}s"
+    lines.append(total)
+    return "\n".join(lines)
+
+
+def _configure(fcg: FlashCardGenerator, name: str, value: Any) -> None:
+    if name == "filename":
+        raise ValueError("The 'filename' option can't be set, the output of a deck is set by its job")
+    setter = getattr(fcg, f"set_{name}", None)
+    if setter is None:
+        raise ValueError(f"Unknown generator option '{name}'")
+    if isinstance(value, dict):
+        setter(**value)
+    elif isinstance(value, list):
+        setter(*value)
+    elif name in _KEYWORD_OPTIONS:
+        setter(**{_KEYWORD_OPTIONS[name]: value})
+    else:
+        setter(value)
+
+
+def main(arguments: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Build many flashcard decks at once, from a directory of deck files or a JSON manifest.")
+    parser.add_argument("source", type=Path, help="a directory of .csv/.tsv/.jsonl decks, or a manifest")
+    parser.add_argument("--output", type=Path, help="where the PDFs go (default: next to the decks, or the manifest's output)")
+    parser.add_argument("--workers", type=int, help="number of processes (default: one per CPU)")
+    parser.add_argument("--engine", choices=ENGINES, help="rendering engine, unless a deck in the manifest sets its own")
+    parser.add_argument("--profile", choices=PROFILES, help="output profile, unless a deck in the manifest sets its own")
+    args = parser.parse_args(arguments)
+
+    options = {name: value for name, value in (("engine", args.engine), ("profile", args.profile)) if value is not None}
+    if args.source.is_dir():
+        jobs = find_decks(args.source, args.output, **options)
+    else:
+        jobs = read_manifest(args.source, args.output, **options)
+
+    start = time.perf_counter()
+    results = []
+    for result in build_decks(jobs, workers=args.workers):
+        results.append(result)
+        print(f"{'ok' if result.ok else 'FAILED'}: {result.job.source}", file=sys.stderr)
+
+    print(format_summary(results, time.perf_counter() - start))
+    return 0 if all(result.ok for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
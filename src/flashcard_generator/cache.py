@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+
+DEFAULT_CACHE_SIZE = 256 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class PageCache:
+    """
+    Rendered front/back page pairs on disk, keyed by a hash of their cards and the layout.
+
+    Every entry is a small PDF document. Once the entries take more than ``max_size`` bytes, the least recently used ones
+    are removed by ``prune()``.
+    """
+
+    directory: Path
+    max_size: int = DEFAULT_CACHE_SIZE
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            document = path.read_bytes()
+            path.touch()  # Keeps recently used entries from being pruned
+        except FileNotFoundError:
+            return None
+        return document
+
+    def put(self, key: str, document: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Written next to the entry and moved in place, so a concurrent build never reads half an entry
+        temporary = self.directory / f".{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        temporary.write_bytes(document)
+        temporary.replace(self._path(key))
+
+    def prune(self) -> None:
+        """Remove the least recently used entries until the cache fits in ``max_size`` again."""
+        entries = []
+        for path in self.directory.glob("*.pdf"):
+            try:
+                entries.append((path.stat(), path))
+            except FileNotFoundError:
+                continue
+
+        size = sum(stat.st_size for stat, _ in entries)
+        for stat, path in sorted(entries, key=lambda entry: entry[0].st_mtime):
+            if size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            size -= stat.st_size
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pdf"
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, overload
+
+from .generator import FlashCard
+from .markup import back_face, front_face
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from .markup import CardFace
+
+FIELDS = ("original", "translation", "extra", "index")
+
+
+class FlashCardDeck:
+    """
+    A compact, list-like store of cards for very large decks.
+
+    Every field is kept in a column of numbers pointing into a pool of strings, so a text that appears on many cards (an
+    extra like ``*(bijwoord)*``, an empty index) is stored once. Cards come back as ``CardView`` objects that read their
+    fields from the columns when asked. Hand a deck to ``FlashCardGenerator(entries=...)`` or to ``generate_stream()``.
+    """
+
+    def __init__(self, cards: Iterable[FlashCard | CardView | Sequence[str]] = ()):
+        self._strings: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._columns = tuple(array("I") for _ in FIELDS)
+        self.extend(cards)
+
+    def add(self, original: str, translation: str, extra: str = "", index: str = "") -> FlashCardDeck:
+        """Add a card, formatting its markdown like ``FlashCard`` does."""
+        format_markdown = FlashCard._format_markdown
+        self._add_fields((format_markdown(original), format_markdown(translation), format_markdown(extra), format_markdown(index)))
+        return self
+
+    def append(self, card: FlashCard | CardView) -> None:
+        self._add_fields((card.original, card.translation, card.extra, card.index))
+
+    def extend(self, cards: Iterable[FlashCard | CardView | Sequence[str]]) -> FlashCardDeck:
+        """Add ``FlashCard`` objects, views, or ``(original, translation[, extra[, index]])`` sequences."""
+        for card in cards:
+            if isinstance(card, (FlashCard, CardView)):
+                self.append(card)
+            else:
+                self.add(*card)
+        return self
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    @overload
+    def __getitem__(self, position: int) -> CardView: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> list[CardView]: ...
+
+    def __getitem__(self, position: int | slice) -> CardView | list[CardView]:
+        if isinstance(position, slice):
+            return [CardView(self, i) for i in range(*position.indices(len(self)))]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("deck index out of range")
+        return CardView(self, position)
+
+    def __iter__(self) -> Iterator[CardView]:
+        return (CardView(self, position) for position in range(len(self)))
+
+    def __getstate__(self) -> dict:
+        return {"strings": self._strings, "columns": self._columns}  # The lookup table is rebuilt from the strings
+
+    def __setstate__(self, state: dict) -> None:
+        self._strings = state["strings"]
+        self._ids = {string: id_ for id_, string in enumerate(self._strings)}
+        self._columns = state["columns"]
+
+    def _add_fields(self, fields: tuple[str, str, str, str]) -> None:
+        for column, text in zip(self._columns, fields):  # noqa: B905
+            id_ = self._ids.get(text)
+            if id_ is None:
+                id_ = self._ids[text] = len(self._strings)
+                self._strings.append(text)
+            column.append(id_)
+
+    def _field(self, column: int, position: int) -> str:
+        return self._strings[self._columns[column][position]]
+
+
+class CardView:
+    """A card in a ``FlashCardDeck``; it reads like a ``FlashCard`` but holds nothing but its position."""
+
+    __slots__ = ("_deck", "_position")
+
+    def __init__(self, deck: FlashCardDeck, position: int):
+        self._deck = deck
+        self._position = position
+
+    @property
+    def original(self) -> str:
+        return self._deck._field(0, self._position)
+
+    @property
+    def translation(self) -> str:
+        return self._deck._field(1, self._position)
+
+    @property
+    def extra(self) -> str:
+        return self._deck._field(2, self._position)
+
+    @property
+    def index(self) -> str:
+        return self._deck._field(3, self._position)
+
+    @property
+    def front(self) -> CardFace:
+        return front_face(self.original, self.extra, self.index)
+
+    @property
+    def back(self) -> CardFace:
+        return back_face(self.translation, self.index)
+
+    def _fields(self) -> tuple[str, str, str, str]:
+        return self.original, self.translation, self.extra, self.index
+
+    def __iter__(self) -> Iterator[str]:
+        """The fields in ``FlashCard`` order, so a view can be passed wherever a ``(original, translation, ...)`` is."""
+        return iter(self._fields())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (CardView, FlashCard)):
+            return NotImplemented
+        return self._fields() == (other.original, other.translation, other.extra, other.index)
+
+    def __hash__(self) -> int:
+        return hash(self._fields())
+
+    def __repr__(self) -> str:
+        original, translation, extra, index = self._fields()
+        return f"CardView(original={original!r}, translation={translation!r}, extra={extra!r}, index={index!r})"
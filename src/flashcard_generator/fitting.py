@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from .measure import split_line
+from .stats import current_stats
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .markup import Line, Markup
+
+MIN_FONT_SIZE = 6  # Text is never shrunk below this size, even if it still doesn't fit
+
+
+@lru_cache(maxsize=16384)
+def wrap_text(text: Markup, font_name: str, font_size: float, max_width: float) -> tuple[Line, ...]:
+    """Wrap every line of ``text`` to ``max_width``."""
+    wrapped: list[Line] = []
+    for line in text:
+        wrapped.extend(split_line(line, font_name, font_size, max_width))
+    return tuple(wrapped)
+
+
+@lru_cache(maxsize=16384)
+def fit_text(text: Markup, font_name: str, font_size: float, leading: float, max_height: float, max_width: float) -> tuple[float, tuple[Line, ...]]:
+    """
+    Find the font size at which the wrapped ``text`` fits in ``max_height``, and the lines it wraps into.
+
+    The candidate sizes are ``font_size``, ``font_size - 1``, ... down to ``MIN_FONT_SIZE``, of which the largest one that fits is chosen
+    (or the smallest one when none fits). Since a smaller font never wraps into more lines, the candidates are binary searched
+    instead of tried one by one.
+    """
+    wrapped = wrap_text(text, font_name, font_size, max_width)
+    if len(wrapped) * leading <= max_height or font_size <= MIN_FONT_SIZE:
+        _count_attempts(1)
+        return font_size, wrapped
+
+    # Smallest number of one point steps down at which the text fits; the last step is taken even if it doesn't.
+    low, high = 1, math.ceil(font_size - MIN_FONT_SIZE)
+    attempts = 2
+    while low < high:
+        middle = (low + high) // 2
+        attempts += 1
+        if len(wrap_text(text, font_name, font_size - middle, max_width)) * leading <= max_height:
+            high = middle
+        else:
+            low = middle + 1
+
+    _count_attempts(attempts)
+    return font_size - low, wrap_text(text, font_name, font_size - low, max_width)
+
+
+def _count_attempts(attempts: int) -> None:
+    stats = current_stats()
+    if stats is not None:
+        stats.fit_attempts += attempts
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+
+_lock = threading.Lock()
+_loaded: set[FontSet] = set()
+_providers: dict[str, FontSet] = {}  # Font name -> the font set it belongs to
+
+
+@dataclass(frozen=True)
+class FontSet:
+    """
+    A font family to set the cards in, registered with reportlab the first time it's needed.
+
+    The variations are registered as ``{name}-Bold``, ``{name}-Oblique`` and ``{name}-BoldOblique``. Leave a file out (None)
+    to use a font that has already been registered under that name.
+    """
+
+    name: str
+    regular: str | None = None
+    bold: str | None = None
+    italic: str | None = None
+    bold_italic: str | None = None
+
+    def files(self) -> list[tuple[str, str | None]]:
+        """The name every variation is registered under, with the file it is loaded from."""
+        return [
+            (self.name, self.regular),
+            (f"{self.name}-Bold", self.bold),
+            (f"{self.name}-Oblique", self.italic),
+            (f"{self.name}-BoldOblique", self.bold_italic),
+        ]
+
+    def load(self) -> None:
+        """Register the fonts with reportlab; only the first call (per process) does any work."""
+        if self in _loaded:
+            return
+
+        with _lock:
+            if self in _loaded:
+                return
+            from reportlab.pdfbase import pdfmetrics
+            from reportlab.pdfbase.ttfonts import TTFont
+
+            for font_name, filename in self.files():
+                if filename is not None:
+                    pdfmetrics.registerFont(TTFont(font_name, filename))
+            _provide(self)
+            _loaded.add(self)
+
+
+def _provide(font_set: FontSet) -> None:
+    """Let ``ensure_font()`` load the fonts that ``font_set`` has files for."""
+    for font_name, filename in font_set.files():
+        if filename is not None:
+            _providers[font_name] = font_set
+
+
+DEFAULT_FONTS = FontSet("DejaVuSans", "DejaVuSans.ttf", "DejaVuSans-Bold.ttf", "DejaVuSans-Oblique.ttf", "DejaVuSans-BoldOblique.ttf")
+_provide(DEFAULT_FONTS)  # Measuring text loads the default fonts, even before anything is generated
+
+
+def ensure_font(font_name: str) -> None:
+    """Make sure the font set ``font_name`` belongs to is loaded, if it belongs to one."""
+    font_set = _providers.get(font_name)
+    if font_set is not None:
+        font_set.load()
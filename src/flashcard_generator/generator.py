@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-import math
+import hashlib
 import re
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass, field, replace
+from io import BytesIO
+from itertools import chain, islice
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -11,10 +14,7 @@ from reportlab.lib.enums import TA_CENTER
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import cm
-from reportlab.lib.utils import simpleSplit
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.pdfmetrics import stringWidth
-from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen.canvas import Canvas
 from reportlab.platypus import (
     Flowable,
     PageBreak,
@@ -23,8 +23,27 @@ from reportlab.platypus import (
     TableStyle,
 )
 
+from .cache import DEFAULT_CACHE_SIZE, PageCache
+from .fonts import DEFAULT_FONTS
+from .grid import GridGeometry, GridRenderer
+from .layout import draw_plan, fit_face, plan_face
+from .markup import back_face, front_face
+from .merge import PdfMerger, parse_pdf
+from .stats import GenerationStats, collecting, current_stats, phase, timed
+
 if TYPE_CHECKING:  # pragma: no cover
     import sys
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+    from concurrent.futures import Executor, Future
+    from typing import BinaryIO
+
+    from .deck import FlashCardDeck
+    from .fonts import FontSet
+    from .indexed import CardRange
+    from .layout import FacePlan
+    from .markup import CardFace
+    from .merge import PdfDocument
+    from .preflight import PreflightReport
 
     if sys.version_info >= (3, 11):
         from typing import Self
@@ -32,11 +51,9 @@ if TYPE_CHECKING:  # pragma: no cover
         Self = "FlashCardGenerator"
 
 
-# Register a default font that supports various styles
-pdfmetrics.registerFont(TTFont("DejaVuSans", "DejaVuSans.ttf"))
-pdfmetrics.registerFont(TTFont("DejaVuSans-Bold", "DejaVuSans-Bold.ttf"))
-pdfmetrics.registerFont(TTFont("DejaVuSans-Oblique", "DejaVuSans-Oblique.ttf"))
-pdfmetrics.registerFont(TTFont("DejaVuSans-BoldOblique", "DejaVuSans-BoldOblique.ttf"))
+_BOLD = re.compile(r"\*\*(.*?)\*\*")
+_ITALIC = re.compile(r"\*(.*?)\*")
+_UNDERLINE = re.compile(r"__(.*?)__")
 
 
 @dataclass
@@ -45,6 +62,8 @@ class FlashCard:
     translation: str
     extra: str = ""  # Placed at the front in smaller letters
     index: str = ""  # Placed at the front right bottom in small letters
+    front: CardFace = field(init=False, repr=False, compare=False)
+    back: CardFace = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.original = self._format_markdown(self.original)
@@ -52,19 +71,53 @@ class FlashCard:
         self.extra = self._format_markdown(self.extra)
         self.index = self._format_markdown(self.index)
 
+        # Parsed once here, so drawing never has to look at the markup again
+        self.front = front_face(self.original, self.extra, self.index)
+        self.back = back_face(self.translation, self.index)
+
     @staticmethod
     def _format_markdown(text: str) -> str:
-        text = re.sub(r"\*\*(.*?)\*\*", r"<b>\1</b>", text)  # Bold
-        text = re.sub(r"\*(.*?)\*", r"<i>\1</i>", text)  # Italic
-        return re.sub(r"__(.*?)__", r"<u>\1</u>", text)  # Underline
+        if "*" not in text and "_" not in text:
+            return text  # Most text has no markdown; skip the substitutions when bulk loading
+        text = _BOLD.sub(r"<b>\1</b>", text)  # Bold
+        text = _ITALIC.sub(r"<i>\1</i>", text)  # Italic
+        return _UNDERLINE.sub(r"<u>\1</u>", text)  # Underline
+
+
+ENGINES = ("platypus", "canvas")
+PROFILES = ("default", "fast", "compact")
+_CACHE_FORMAT = 1  # Bump when a change to the drawing code invalidates cached pages
+
+
+class _LazyStory(list):
+    """
+    A story that pulls its flowables from an iterator of pages, one page at a time.
+
+    ``BaseDocTemplate.build`` checks ``len(flowables)`` before handling every flowable, so refilling the list there
+    means only the page currently being laid out is ever kept in memory.
+    """
+
+    def __init__(self, pages: Iterator[list[Flowable]]):
+        super().__init__()
+        self._pages = pages
+
+    def __len__(self) -> int:
+        while not super().__len__():
+            page = next(self._pages, None)
+            if page is None:
+                break
+            self.extend(page)
+        return super().__len__()
 
 
 class IndexedCardContent(Flowable):
-    def __init__(self, card: FlashCard, style: ParagraphStyle):
+    """A card face in a table cell, drawn from its plan (see ``plan_face()``)."""
+
+    def __init__(self, face: CardFace, style: ParagraphStyle, plan: FacePlan | None = None):
         Flowable.__init__(self)
-        self.card = card
+        self.face = face
         self.style = style
-        self.style.fontName = "DejaVuSans"
+        self.plan = plan
 
     def wrap(self, avail_width, avail_height):
         self.width = avail_width
@@ -74,106 +127,24 @@ class IndexedCardContent(Flowable):
     def draw(self):
         canvas = self.canv
         canvas.saveState()
-
-        # Calculate the space available for the main content
-        main_content_height = self.height - (2 * self.style.leading)  # Reserve space for extra and index
-
-        self._draw_wrapped_text(self.card.original, self.style.fontSize, main_content_height, self.width, self.width / 2, self.height / 2)
-
-        if self.card.extra:
-            extra_style = ParagraphStyle("Extra", parent=self.style, fontSize=8, leading=10)
-            self._draw_wrapped_text(self.card.extra, extra_style.fontSize, self.style.leading, self.width, self.width / 2, 17, style=extra_style)
-
-        if self.card.index:
-            index_style = ParagraphStyle("Index", parent=self.style, fontSize=6, leading=8)
-            self._draw_text(self.card.index, index_style.fontSize, 2, self.width - 2, align="right", style=index_style)
-
+        with phase("draw"):
+            draw_plan(canvas, self.face_plan(), 0, 0)
         canvas.restoreState()
 
-    def _draw_wrapped_text(self, text, font_size, max_height, max_width, x, y, align="center", style=None):
-        if style is None:
-            style = self.style
+    def draw_at(self, canvas: Canvas, x: float, y: float) -> None:
+        """Draw straight onto ``canvas`` at (x, y), without the save/translate/restore that ``drawOn`` wraps around ``draw``."""
+        draw_plan(canvas, self.face_plan(), x, y)
 
-        lines = text.split("<br/>")
-        wrapped_lines = []
-
-        for line in lines:
-            wrapped_lines.extend(simpleSplit(line, style.fontName, font_size, max_width))
-
-        total_height = len(wrapped_lines) * style.leading
-        if total_height > max_height:
-            # If text is too tall, reduce font size
-            while total_height > max_height and font_size > 6:
-                font_size -= 1
-                wrapped_lines = []
-                for line in lines:
-                    wrapped_lines.extend(simpleSplit(line, style.fontName, font_size, max_width))
-                total_height = len(wrapped_lines) * style.leading
-
-        # Calculate starting y position for vertical centering
-        start_y = y + (total_height / 2) - (style.leading / 2)
-
-        for line in wrapped_lines:
-            self._draw_text(line, font_size, start_y, x, align, style)
-            start_y -= style.leading
-
-    def _calculate_start_position(self, x, align, line_width):
-        if align == "center":
-            return x - line_width / 2
-
-        if align == "right":
-            return x - line_width
-
-        # left align
-        return x
-
-    def _draw_text(self, text, font_size, y, x, align="center", style=None):
-        if style is None:
-            style = self.style
-
-        canvas = self.canv
-        fragments = re.split(r"(<[^>]+>)", text)
-        line_width = sum(stringWidth(f, style.fontName, font_size) for f in fragments if not f.startswith("<"))
-
-        # Calculate starting x position
-        start_x = self._calculate_start_position(x, align, line_width)
-
-        current_x = start_x
-        current_font = style.fontName
-        for fragment in fragments:
-            if fragment.startswith("<"):
-                current_font = self._interpret_fragment(current_font, fragment, style)
-            else:
-                canvas.setFont(current_font, font_size)
-                canvas.drawString(current_x, y, fragment)
-                f_width = stringWidth(fragment, current_font, font_size)
-                if getattr(self, "underline", False):
-                    canvas.line(current_x, y - 2, current_x + f_width, y - 2)
-                current_x += f_width
-
-    def _interpret_fragment(self, current_font, fragment, style):
-        if fragment == "<b>":
-            current_font = self._get_font_variation(style.fontName, "Bold")
-        elif fragment == "</b>":
-            current_font = style.fontName
-        elif fragment == "<i>":
-            current_font = self._get_font_variation(style.fontName, "Oblique")
-        elif fragment == "</i>":
-            current_font = style.fontName
-        elif fragment == "<u>":
-            self.underline = True
-        elif fragment == "</u>":
-            self.underline = False
-        return current_font
-
-    @staticmethod
-    def _get_font_variation(base_font, variation):
-        return f"{base_font}-{variation}"
+    def face_plan(self) -> FacePlan:
+        """The plan made ahead of drawing, or a new one if the content ended up in a box of another size."""
+        if self.plan is None or self.plan.size != (self.width, self.height):
+            self.plan = plan_face(self.face, self.style.fontName, self.style.fontSize, self.style.leading, self.width, self.height)
+        return self.plan
 
 
 @dataclass
 class FlashCardGenerator:
-    entries: list[FlashCard] = field(default_factory=list)
+    entries: list[FlashCard] | FlashCardDeck | CardRange = field(default_factory=list)
     cards_per_row: int = 5
     filename: Path = Path("flashcards.pdf")
     page_size: tuple[float, float] = A4
@@ -182,11 +153,28 @@ class FlashCardGenerator:
     left_margin: float = 0.5 * cm
     right_margin: float = 0.5 * cm
     card_height: float = 2.3 * cm
+    engine: str = "platypus"
+    fonts: FontSet = DEFAULT_FONTS
+    workers: int = 1
+    pages_per_chunk: int = 50
+    cache: PageCache | None = None
+    forms: bool = False
+    profile: str = "default"
 
     def add_entry(self, original: str, translation: str, extra: str = "", index: str = "") -> Self:
         self.entries.append(FlashCard(original, translation, extra, index))
         return self
 
+    def add_entries(self, entries: Iterable[FlashCard | Sequence[str]]) -> Self:
+        """
+        Add many entries at once, e.g. from one of the ``flashcard_generator.loaders``.
+
+        Entries are ``FlashCard`` objects or ``(original, translation[, extra[, index]])`` sequences, like the cards of a
+        ``FlashCardDeck``; they are built and added in a single pass instead of one ``add_entry()`` call each.
+        """
+        self.entries.extend(entry if isinstance(entry, FlashCard) else FlashCard(*entry) for entry in entries)
+        return self
+
     def set_cards_per_row(self, count: int) -> Self:
         self.cards_per_row = count
         return self
@@ -221,54 +209,447 @@ class FlashCardGenerator:
         self.card_height = height
         return self
 
-    def generate(self) -> None:
-        doc = SimpleDocTemplate(
-            str(self.filename.resolve().absolute()),
+    def set_engine(self, engine: str) -> Self:
+        """
+        Select the rendering engine.
+
+        ``"platypus"`` lays out every page as a reportlab ``Table`` in a ``SimpleDocTemplate``.
+        ``"canvas"`` computes the card grid directly and draws it straight onto the canvas, which is a lot faster for large decks.
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}, expected one of {', '.join(ENGINES)}")
+        self.engine = engine
+        return self
+
+    def set_fonts(self, fonts: FontSet) -> Self:
+        self.fonts = fonts
+        return self
+
+    def set_workers(self, count: int, *, pages_per_chunk: int | None = None) -> Self:
+        """
+        Render the deck on ``count`` processes.
+
+        The deck is split in chunks of ``pages_per_chunk`` front/back page pairs, which are rendered in parallel and merged back
+        into a single PDF. Every chunk embeds its own copy of the fonts, so larger chunks make for smaller files.
+        """
+        self.workers = count
+        if pages_per_chunk is not None:
+            self.pages_per_chunk = pages_per_chunk
+        return self
+
+    def set_cache(self, directory: str | Path | None, *, max_size: int = DEFAULT_CACHE_SIZE) -> Self:
+        """
+        Keep rendered pages in ``directory`` and reuse them for pages whose cards and layout haven't changed.
+
+        The cache holds at most about ``max_size`` bytes; the least recently used pages go first. Pass None to turn it off.
+        """
+        self.cache = None if directory is None else PageCache(Path(directory), max_size)
+        return self
+
+    def set_forms(self, *, enabled: bool = True) -> Self:
+        """
+        Draw the page grid once as a form XObject that every page refers to, and reuse every card face that repeats the same way.
+
+        This makes for smaller files that are quicker to write and to display. It needs the canvas engine.
+        """
+        self.forms = enabled
+        return self
+
+    def set_profile(self, profile: str) -> Self:
+        """
+        Select how the output is written, trading write speed against file size.
+
+        ``"default"`` compresses the pages the way reportlab does. ``"fast"`` compresses nothing, which is the quickest to
+        write but makes for much larger files. ``"compact"`` writes the compressed streams as binary instead of ASCII85
+        encoded text and compresses them as tightly as zlib goes, which takes longer. ``generate(stats=True)`` reports the
+        resulting size in ``output_bytes``.
+        """
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown profile {profile!r}, expected one of {', '.join(PROFILES)}")
+        self.profile = profile
+        return self
+
+    def generate(self, *, stats: bool = False) -> GenerationStats | None:
+        """Generate the PDF; with ``stats``, return the time spent per phase and what was produced (see ``GenerationStats``)."""
+        return self._generate(self.entries, str(self.filename.resolve().absolute()), stats=stats)
+
+    def generate_to(self, stream: BinaryIO, *, stats: bool = False) -> GenerationStats | None:
+        """
+        Generate the PDF into a binary ``stream`` (a ``BytesIO``, an open file, a response body) instead of ``filename``.
+
+        Generating leaves the generator and its entries as they are and shares no other mutable state, so decks can be
+        rendered on many threads at once, even by the same generator, as long as nothing is added to it meanwhile.
+        """
+        return self._generate(self.entries, stream, stats=stats)
+
+    def generate_bytes(self) -> bytes:
+        """Generate the PDF in memory and return it."""
+        output = BytesIO()
+        self.generate_to(output)
+        return output.getvalue()
+
+    async def generate_bytes_async(self, executor: Executor | None = None) -> bytes:
+        """``generate_bytes()`` on ``executor`` (the event loop's default thread pool if None), keeping the event loop free."""
+        import asyncio  # Costs tens of milliseconds to import, for this method only
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.generate_bytes)
+
+    def generate_stream(self, entries: Iterable[FlashCard], *, stats: bool = False) -> GenerationStats | None:
+        """
+        Generate the PDF from an iterable of entries, laying out one front/back page pair at a time.
+
+        Unlike ``generate()``, the entries are never collected in memory, so ``entries`` can be a generator over an arbitrarily
+        large deck. A deck of more than ``pages_per_chunk`` page pairs is rendered a chunk at a time, every chunk written out
+        to the file before the next one is read, so memory use stays flat however long the deck is. Padding and mirroring
+        are the same as in ``generate()``.
+        """
+        return self._generate(entries, str(self.filename.resolve().absolute()), stats=stats, streamed=True)
+
+    def preflight(self, entries: Iterable[FlashCard] | None = None) -> PreflightReport:
+        """
+        Work out how the deck (``entries``, or the added entries if None) would print, without drawing anything.
+
+        The cards are laid out and their texts fitted exactly as ``generate()`` does, which gives the page count and the font
+        size every text ends up at, including the ones that had to shrink or that still overflow at the minimum size.
+        """
+        from .preflight import CardReport, PreflightReport  # Only needed here
+
+        self.fonts.load()
+        style = self._create_style()
+        width, height = self._geometry().content_size()
+        report = PreflightReport()
+        cards = 0
+
+        def counted(entries: Iterable[FlashCard]) -> Iterator[FlashCard]:
+            nonlocal cards
+            for entry in entries:
+                cards += 1
+                yield entry
+
+        for page, page_entries in enumerate(self._paginate(counted(self.entries if entries is None else entries))):
+            for entry in page_entries[: cards - len(report.cards)]:  # Leaves out the padding
+                front, extra = fit_face(entry.front, style.fontName, style.fontSize, style.leading, width, height)
+                back, _ = fit_face(entry.back, style.fontName, style.fontSize, style.leading, width, height)
+                report.cards.append(CardReport(len(report.cards), 2 * page + 1, entry, front, extra, back))
+            report.pages += 2
+
+        return report
+
+    def _generate(self, entries: Iterable[FlashCard], output: str | BinaryIO, *, stats: bool, streamed: bool = False) -> GenerationStats | None:
+        with collecting(GenerationStats() if stats else None) as collected:
+            self._render(entries, output, streamed=streamed)
+        return collected
+
+    def _render(self, entries: Iterable[FlashCard], output: str | BinaryIO, *, streamed: bool = False) -> None:
+        if self.forms and self.engine != "canvas":
+            raise ValueError("Drawing with forms needs the canvas engine")
+        self.fonts.load()
+        stats = current_stats()
+        if stats is not None:
+            entries = timed("read", entries)
+            start = output.tell() if not isinstance(output, str) and output.seekable() else 0
+
+        if self.cache is not None:
+            self._render_cached(entries, output, self.cache)
+        elif self.workers > 1:
+            self._render_parallel(entries, output)  # Every worker compacts its own chunk
+        elif streamed:
+            self._render_chunked(entries, output)
+        elif self.profile == "compact":
+            self._render_compact(entries, output)
+        elif self.engine == "canvas":
+            self._render_canvas(entries, output)
+        else:
+            doc = self._create_document(output)
+            with phase("write"):
+                doc.build(_LazyStory(self._stream_pages(entries)))
+            if stats is not None:
+                stats.pages = doc.page
+
+        if stats is not None:
+            # Counted on the output last, so the outermost render (e.g. the merge of parallel chunks) has the final say
+            if isinstance(output, str):
+                stats.output_bytes = Path(output).stat().st_size
+            elif output.seekable():
+                stats.output_bytes = output.tell() - start
+
+    def _render_canvas(self, entries: Iterable[FlashCard], output: str | BinaryIO) -> None:
+        canvas = Canvas(output, pagesize=self.page_size, pageCompression=self._page_compression())
+        renderer = GridRenderer(canvas, self._geometry(), forms=self.forms)
+        centered_style = self._create_style()
+
+        for page_entries in self._paginate(entries):
+            with phase("layout"):
+                front_data, back_data = self._page_data(page_entries, centered_style)
+            with phase("draw"):
+                renderer.draw_page(front_data)
+                renderer.draw_page(back_data)
+
+        with phase("write"):
+            canvas.save()
+
+        stats = current_stats()
+        if stats is not None:
+            stats.pages = canvas.getPageNumber() - 1
+
+    def _render_compact(self, entries: Iterable[FlashCard], output: str | BinaryIO) -> None:
+        """Render the document in memory, then write it out with every stream compressed again."""
+        if isinstance(output, str):
+            with Path(output).open("wb") as stream:
+                self._render_compact(entries, stream)
+            return
+
+        document = BytesIO()
+        replace(self, profile="default")._render(entries, document)
+        with phase("write"):
+            merger = PdfMerger(output, compact=True)
+            merger.add(document.getvalue())
+            merger.close()
+
+    def _render_chunked(self, entries: Iterable[FlashCard], output: str | BinaryIO) -> None:
+        """Render a chunk of pages at a time, merging every chunk into the output before the next one is read."""
+        if isinstance(output, str):
+            with Path(output).open("wb") as stream:
+                self._render_chunked(entries, stream)
+            return
+
+        worker = replace(self, entries=[])
+        chunks = self._chunk(entries)
+        first = next(chunks, [])
+        second = next(chunks, None)
+        if second is None:
+            worker._render(first, output)  # A single chunk goes straight to the output, as in generate()
+            return
+
+        merger = PdfMerger(output)
+        for chunk in chain([first, second], chunks):
+            document = BytesIO()
+            worker._render(chunk, document)
+            with phase("write"):
+                merger.add(document.getvalue())
+
+        with phase("write"):
+            merger.close()
+        stats = current_stats()
+        if stats is not None:
+            stats.pages = merger.pages
+
+    def _render_parallel(self, entries: Iterable[FlashCard], output: str | BinaryIO) -> None:
+        from concurrent.futures import ProcessPoolExecutor  # Pulls in multiprocessing, which only this needs
+
+        from .deck import FlashCardDeck  # The deck is built on FlashCard
+
+        if isinstance(output, str):
+            with Path(output).open("wb") as stream:
+                self._render_parallel(entries, stream)
+            return
+
+        worker = replace(self, entries=[], workers=1)
+        merger = PdfMerger(output)
+        stats = current_stats()
+
+        def merge(future: Future[tuple[bytes, GenerationStats | None]]) -> None:
+            document, chunk_stats = future.result()
+            if stats is not None and chunk_stats is not None:
+                stats.add(chunk_stats)
+            with phase("write"):
+                merger.add(document)
+
+        with ProcessPoolExecutor(self.workers) as pool:
+            pending: deque[Future[tuple[bytes, GenerationStats | None]]] = deque()
+            for chunk in self._chunk(entries):
+                # Sent over as a deck: a fraction of the size of the cards themselves
+                pending.append(pool.submit(_render_chunk, worker, FlashCardDeck(chunk), stats=stats is not None))
+                # Keep every worker busy, without rendering ahead of what has been merged so far
+                if len(pending) > 2 * self.workers:
+                    merge(pending.popleft())
+
+            while pending:
+                merge(pending.popleft())
+
+        with phase("write"):
+            merger.close()
+        if stats is not None:
+            stats.pages = merger.pages
+
+    def _render_cached(self, entries: Iterable[FlashCard], output: str | BinaryIO, cache: PageCache) -> None:
+        if isinstance(output, str):
+            with Path(output).open("wb") as stream:
+                self._render_cached(entries, stream, cache)
+            return
+
+        renderer = replace(self, cache=None)
+        layout = self._layout_key()
+        merger = PdfMerger(output)
+
+        pages = self._paginate(entries)
+        while window := list(islice(pages, self.pages_per_chunk * self.workers)):
+            keys = [self._page_key(layout, page_entries) for page_entries in window]
+            with phase("write"):
+                documents = {key: cache.get(key) for key in keys}
+
+            # Everything missing from the cache is rendered together, so the new pages share their fonts
+            missing = {key: page_entries for key, page_entries in zip(keys, window) if documents[key] is None}  # noqa: B905
+            if missing:
+                rendered = BytesIO()
+                renderer._render([entry for page_entries in missing.values() for entry in page_entries], rendered)
+                with phase("write"):
+                    pdf = parse_pdf(rendered.getvalue())
+                    for position, key in enumerate(missing):
+                        documents[key] = _extract_pages(pdf, [2 * position, 2 * position + 1])
+                        cache.put(key, documents[key])
+
+            with phase("write"):
+                for key in keys:
+                    merger.add(documents[key])
+
+        with phase("write"):
+            merger.close()
+            cache.prune()
+
+        stats = current_stats()
+        if stats is not None:
+            stats.pages = merger.pages
+
+    def _layout_key(self) -> bytes:
+        """Everything besides the cards that changes how a page looks."""
+        layout = (
+            _CACHE_FORMAT,
+            self.engine,
+            self.cards_per_row,
+            self.card_height,
+            tuple(self.page_size),
+            self.top_margin,
+            self.bottom_margin,
+            self.left_margin,
+            self.right_margin,
+            self.fonts,
+            self.forms,
+            self.profile,
+        )
+        return repr(layout).encode()
+
+    @staticmethod
+    def _page_key(layout: bytes, page_entries: list[FlashCard]) -> str:
+        cards = repr([(entry.original, entry.translation, entry.extra, entry.index) for entry in page_entries])
+        return hashlib.sha256(layout + cards.encode()).hexdigest()
+
+    def _chunk(self, entries: Iterable[FlashCard]) -> Iterator[list[FlashCard]]:
+        """Split the (padded) entries into chunks of whole pages."""
+        chunk: list[FlashCard] = []
+        for pages, page_entries in enumerate(self._paginate(entries), start=1):
+            chunk.extend(page_entries)
+            if pages % self.pages_per_chunk == 0:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
+    def _stream_pages(self, entries: Iterable[FlashCard]) -> Iterator[list[Flowable]]:
+        centered_style = self._create_style()
+        card_width = self._card_width()
+
+        for page_entries in self._paginate(entries):
+            story: list[Flowable] = []
+            with phase("layout"):
+                for data in self._page_data(page_entries, centered_style):
+                    self._place_on_page(self.card_height, card_width, self.cards_per_row, data, story)
+            yield story
+
+    def _paginate(self, entries: Iterable[FlashCard]) -> Iterator[list[FlashCard]]:
+        """Split the entries into pages, padding the last row when the deck spans more than one row."""
+        cards_per_page = self._cards_per_page()
+        page_entries: list[FlashCard] = []
+        seen = 0
+
+        for entry in entries:
+            page_entries.append(entry)
+            seen += 1
+            if len(page_entries) == cards_per_page:
+                yield page_entries
+                page_entries = []
+
+        if page_entries:
+            if seen > self.cards_per_row:
+                while len(page_entries) % self.cards_per_row != 0:
+                    page_entries.append(FlashCard("", "", ""))
+            yield page_entries
+
+    def _create_document(self, output: str | BinaryIO) -> SimpleDocTemplate:
+        return SimpleDocTemplate(
+            output,
             pagesize=self.page_size,
             topMargin=self.top_margin,
             bottomMargin=self.bottom_margin,
             leftMargin=self.left_margin,
             rightMargin=self.right_margin,
+            pageCompression=self._page_compression(),
         )
-        story = []
 
-        page_width, page_height = self.page_size
-        card_width = page_width / self.cards_per_row - 0.2 * cm
-
-        cards_per_page = self.cards_per_row * math.floor((page_height - 1 * cm) / self.card_height)
-
-        if len(self.entries) > self.cards_per_row:
-            while len(self.entries) % self.cards_per_row != 0:
-                self.entries.append(FlashCard("", "", ""))
+    def _page_compression(self) -> int | None:
+        """Whether reportlab compresses the streams; None leaves it to its configuration."""
+        return {"fast": 0, "compact": 1}.get(self.profile)
 
+    def _create_style(self) -> ParagraphStyle:
         styles = getSampleStyleSheet()
-        centered_style = ParagraphStyle(name="Centered", parent=styles["Normal"], alignment=TA_CENTER, fontName="DejaVuSans")
+        return ParagraphStyle(name="Centered", parent=styles["Normal"], alignment=TA_CENTER, fontName=self.fonts.name)
+
+    def _card_width(self) -> float:
+        return self.page_size[0] / self.cards_per_row - 0.2 * cm
+
+    def _cards_per_page(self) -> int:
+        return self.cards_per_row * self._geometry().rows_per_page()
+
+    def _geometry(self) -> GridGeometry:
+        return GridGeometry(
+            page_size=self.page_size,
+            card_width=self._card_width(),
+            card_height=self.card_height,
+            top_margin=self.top_margin,
+            bottom_margin=self.bottom_margin,
+            left_margin=self.left_margin,
+            right_margin=self.right_margin,
+        )
 
-        for i in range(0, len(self.entries), cards_per_page):
-            page_entries = self.entries[i : i + cards_per_page]
+    def _page_data(self, page_entries: list[FlashCard], style: ParagraphStyle) -> tuple[list[list[IndexedCardContent]], list[list[IndexedCardContent]]]:
+        """
+        The rows of card contents for the front and the mirrored back side of a single page of entries.
 
-            front_data = [
-                [self._create_front_content(entry, centered_style) for entry in page_entries[j : j + self.cards_per_row]]
-                for j in range(0, len(page_entries), self.cards_per_row)
-            ]
+        Every face is planned here, ahead of drawing; identical faces share their plan.
+        """
+        plan = self._planner(style)
+        front_data = [
+            [IndexedCardContent(entry.front, style, plan(entry.front)) for entry in page_entries[j : j + self.cards_per_row]]
+            for j in range(0, len(page_entries), self.cards_per_row)
+        ]
 
-            self._place_on_page(self.card_height, card_width, self.cards_per_row, front_data, story)
+        back_data = [
+            [IndexedCardContent(entry.back, style, plan(entry.back)) for entry in reversed(page_entries[j : j + self.cards_per_row])]
+            for j in range(0, len(page_entries), self.cards_per_row)
+        ]
 
-            back_data = [
-                [
-                    IndexedCardContent(FlashCard(entry.translation, "", index=entry.index), centered_style)
-                    for entry in reversed(page_entries[j : j + self.cards_per_row])
-                ]
-                for j in range(0, len(page_entries), self.cards_per_row)
-            ]
+        return front_data, back_data
 
-            self._place_on_page(self.card_height, card_width, self.cards_per_row, back_data, story)
+    def _planner(self, style: ParagraphStyle) -> Callable[[CardFace], FacePlan]:
+        """Plans faces for the content box of this layout."""
+        width, height = self._geometry().content_size()
+        stats = current_stats()
 
-        doc.build(story)
+        def plan(face: CardFace) -> FacePlan:
+            if stats is None:
+                return plan_face(face, style.fontName, style.fontSize, style.leading, width, height)
 
-    @classmethod
-    def _create_front_content(cls, entry: FlashCard, style: ParagraphStyle) -> IndexedCardContent:
-        return IndexedCardContent(entry, style)
+            with stats.phase("fit"):
+                face_plan = plan_face(face, style.fontName, style.fontSize, style.leading, width, height)
+            for text in face_plan.texts:
+                stats.texts_fitted += 1
+                stats.texts_shrunk += text.shrunk
+                stats.texts_overflowing += text.overflowing
+            return face_plan
+
+        return plan
 
     @staticmethod
     def _place_on_page(card_height: float, card_width: float, cards_per_row: int, data: list[list[Flowable]], story: list[Flowable]) -> None:
@@ -288,3 +669,20 @@ class FlashCardGenerator:
         )
         story.append(table)
         story.append(PageBreak())
+
+
+def _render_chunk(generator: FlashCardGenerator, entries: FlashCardDeck, *, stats: bool) -> tuple[bytes, GenerationStats | None]:
+    """Render a chunk of whole pages into a PDF document of its own; runs in a worker process."""
+    output = BytesIO()
+    with collecting(GenerationStats() if stats else None) as collected:
+        generator._render(entries, output)
+    return output.getvalue(), collected
+
+
+def _extract_pages(pdf: PdfDocument, pages: list[int]) -> bytes:
+    """A PDF document with only the ``pages`` of ``pdf``."""
+    output = BytesIO()
+    merger = PdfMerger(output)
+    merger.add(pdf, pages)
+    merger.close()
+    return output.getvalue()
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from reportlab.lib import colors
+
+from .layout import draw_runs
+
+if TYPE_CHECKING:  # pragma: no cover
+    from reportlab.pdfgen.canvas import Canvas
+
+    from .generator import IndexedCardContent
+    from .layout import FacePlan, PlacedRun
+
+# These mirror the reportlab defaults used by the platypus engine, so both engines put everything in the same place.
+FRAME_PADDING = 6  # Frame padding of SimpleDocTemplate
+CELL_PADDING_X = 6  # Left/right padding of a Table cell
+CELL_PADDING_Y = 3  # Top/bottom padding of a Table cell
+GRID_WIDTH = 2
+GRID_COLOR = colors.black
+SEEN_FACES = 4096  # How many faces are counted to spot repeats, when drawing with forms
+# A form costs a few hundred bytes of its own, and every use a reference from the page, while repeats in a page are
+# compressed well already: only faces with a lot of text that keep coming back are worth putting into a form
+FORM_MIN_RUNS = 2
+FORM_AFTER = 16  # Times a face is drawn as is before it's put into a form
+
+
+@dataclass(frozen=True)
+class GridGeometry:
+    """The fixed arithmetic layout of a page of cards."""
+
+    page_size: tuple[float, float]
+    card_width: float
+    card_height: float
+    top_margin: float
+    bottom_margin: float
+    left_margin: float
+    right_margin: float
+
+    def rows_per_page(self) -> int:
+        """How many rows of cards fit between the margins, so that a page's Table is never split over two pages."""
+        frame_height = self.page_size[1] - self.top_margin - self.bottom_margin - 2 * FRAME_PADDING
+        rows = math.floor(frame_height / self.card_height)
+        if rows < 1:
+            raise ValueError(f"Cards of {self.card_height:g} pt don't fit between the margins, which leave {frame_height:g} pt")
+        return rows
+
+    def origin(self, rows: int, cols: int) -> tuple[float, float]:
+        """Bottom-left corner of a grid of ``rows`` x ``cols`` cards, centered at the top of the page like a Table in a Frame."""
+        page_width, page_height = self.page_size
+        available_width = page_width - self.left_margin - self.right_margin - 2 * FRAME_PADDING
+        x = self.left_margin + FRAME_PADDING + (available_width - cols * self.card_width) / 2
+        y = page_height - self.top_margin - FRAME_PADDING - rows * self.card_height
+        return x, y
+
+    def content_size(self) -> tuple[float, float]:
+        """The size a card's content is given inside its cell."""
+        # Same arithmetic as Table, so both engines plan the cards for exactly the same box
+        return self.card_width - CELL_PADDING_X - CELL_PADDING_X, self.card_height - CELL_PADDING_Y - CELL_PADDING_Y
+
+
+class GridRenderer:
+    """
+    Draws pages of card contents straight onto a canvas, without going through Table/SimpleDocTemplate.
+
+    With ``forms``, the grid is drawn once as a form XObject that every page refers to. Card faces with a lot of text are
+    drawn as is the first few times; once they keep coming back, they are put into a form that is reused from then on. The
+    index is left out of the forms, so cards with the same texts share a form whatever their indices.
+    """
+
+    def __init__(self, canvas: Canvas, geometry: GridGeometry, *, forms: bool = False):
+        self.canvas = canvas
+        self.geometry = geometry
+        self.forms = forms
+        self._grids: set[tuple[int, int]] = set()
+        self._faces: dict[tuple[PlacedRun, ...], str] = {}  # Runs -> name of their form
+        self._seen: dict[tuple[PlacedRun, ...], int] = {}  # Runs -> times drawn as is
+
+    def draw_page(self, data: list[list[IndexedCardContent]]) -> None:
+        if data:
+            rows, cols = len(data), len(data[0])
+            x0, y0 = self.geometry.origin(rows, cols)
+            content_width, content_height = self.geometry.content_size()
+
+            for row_no, row in enumerate(data):
+                y = y0 + (rows - 1 - row_no) * self.geometry.card_height + CELL_PADDING_Y
+                for col_no, content in enumerate(row):
+                    content.wrap(content_width, content_height)
+                    x = x0 + col_no * self.geometry.card_width + CELL_PADDING_X
+                    if self.forms:
+                        self.draw_face(content.face_plan(), x, y)
+                    else:
+                        content.draw_at(self.canvas, x, y)
+
+            if self.forms:
+                self.canvas.doForm(self._grid_form(rows, cols))
+            else:
+                self.canvas.saveState()
+                self.draw_grid(rows, cols)
+                self.canvas.restoreState()
+
+        self.canvas.showPage()
+
+    def draw_face(self, plan: FacePlan, x: float, y: float) -> None:
+        """Draw a planned face at (x, y), through a form if the same texts were drawn before."""
+        body = plan.body
+        if len(body) < FORM_MIN_RUNS:
+            draw_runs(self.canvas, plan.runs, x, y)
+            return
+
+        name = self._faces.get(body)
+        if name is None and self._seen.get(body, 0) >= FORM_AFTER:
+            del self._seen[body]
+            name = self._faces[body] = f"face{len(self._faces)}"
+            # The bounding box clips, so leave room for text overflowing the card
+            width, height = self.geometry.page_size
+            self.canvas.beginForm(name, -width, -height, width, height)
+            draw_runs(self.canvas, body, 0, 0)
+            self.canvas.endForm()
+
+        if name is not None:
+            self.canvas.saveState()
+            self.canvas.translate(x, y)
+            self.canvas.doForm(name)
+            self.canvas.restoreState()
+        else:
+            if len(self._seen) >= SEEN_FACES:
+                self._seen.clear()
+            self._seen[body] = self._seen.get(body, 0) + 1
+            draw_runs(self.canvas, body, x, y)
+
+        draw_runs(self.canvas, plan.index, x, y)
+
+    def _grid_form(self, rows: int, cols: int) -> str:
+        name = f"grid{rows}x{cols}"
+        if (rows, cols) not in self._grids:
+            self._grids.add((rows, cols))
+            self.canvas.beginForm(name)
+            self.draw_grid(rows, cols)
+            self.canvas.endForm()
+        return name
+
+    def draw_grid(self, rows: int, cols: int) -> None:
+        x0, y0 = self.geometry.origin(rows, cols)
+        x1 = x0 + cols * self.geometry.card_width
+        y1 = y0 + rows * self.geometry.card_height
+
+        canvas = self.canvas
+        canvas.setLineCap(1)
+        canvas.setLineJoin(1)
+        canvas.setStrokeColor(GRID_COLOR)
+        canvas.setLineWidth(GRID_WIDTH)
+        canvas.lines(
+            [(x0, y0 + row * self.geometry.card_height, x1, y0 + row * self.geometry.card_height) for row in range(rows + 1)]
+            + [(x0 + col * self.geometry.card_width, y0, x0 + col * self.geometry.card_width, y1) for col in range(cols + 1)]
+        )
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, overload
+
+from .generator import FlashCard
+from .loaders import _column_positions, _csv_fields, _jsonl_fields, _jsonl_keys
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator, Sequence
+    from typing import BinaryIO
+
+# Magic, options digest, source size, source modification time, number of cards, size of the index map; then the byte
+# offset of every card (8 bytes each) and the index map: the positions of the cards per index field value, as JSON
+_HEADER = struct.Struct("=8s8sQqQQ")
+_MAGIC = b"FCINDEX1"
+
+
+class IndexedSource:
+    """
+    A CSV, TSV or JSON Lines deck with random access to its cards, through an index in a sidecar file.
+
+    The index (``<filename>.idx``) holds where every card starts in the file and which cards have which ``index`` field. It
+    is built on first use, by reading the file once, and again whenever the file or the reading options change. After that,
+    getting card N is a lookup in the memory-mapped index and a seek, whatever the size of the file.
+
+    ``source[n]`` is a ``FlashCard``; ``source[a:b]`` and ``where_index()`` are ``CardRange`` objects that read their cards
+    when iterated, so they can be handed to ``FlashCardGenerator(entries=...)`` to render just those cards. The options are
+    the ones of ``read_csv()`` or ``read_jsonl()``; the encoding has to be ASCII compatible, like UTF-8.
+    """
+
+    def __init__(self, filename: str | Path, **options: Any):
+        self.filename = Path(filename)
+        self.index_filename = self.filename.with_name(self.filename.name + ".idx")
+        suffix = self.filename.suffix.lower()
+        if suffix in (".jsonl", ".ndjson"):
+            self._reader = _JsonlReader(**options)
+        elif suffix in (".csv", ".tsv", ".tab"):
+            self._reader = _CsvReader(self.filename, **({"delimiter": "\t"} if suffix != ".csv" else {}), **options)
+        else:
+            raise ValueError(f"Unknown deck format '{suffix}', expected .csv, .tsv or .jsonl")
+
+        digest = hashlib.sha256(repr((sorted(options.items()), suffix, sys.byteorder)).encode()).digest()[:8]
+        if not self._load(digest):
+            self._build(digest)
+            if not self._load(digest):
+                raise RuntimeError(f"Index {self.index_filename} changed while it was being opened")
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @overload
+    def __getitem__(self, position: int) -> FlashCard: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> CardRange: ...
+
+    def __getitem__(self, position: int | slice) -> FlashCard | CardRange:
+        if isinstance(position, slice):
+            return CardRange(self, range(*position.indices(len(self))))
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("card position out of range")
+        return next(self.read([position]))
+
+    def __iter__(self) -> Iterator[FlashCard]:
+        return self.read(range(len(self)))
+
+    def where_index(self, *values: str) -> CardRange:
+        """The cards whose ``index`` field is one of ``values``, in file order."""
+        if self._index_map is None:
+            self._index_map = json.loads(self._mmap[self._map_start :])
+        positions = sorted(position for value in values for position in self._index_map.get(value, ()))
+        return CardRange(self, positions)
+
+    def read(self, positions: Iterable[int]) -> Iterator[FlashCard]:
+        """The cards at ``positions``; runs of consecutive cards are read in one go."""
+        with self.filename.open("rb") as file:
+            expected = None
+            records: Iterator[tuple[str, ...]] = iter(())
+            for position in positions:
+                if position != expected:
+                    file.seek(self._offsets[position])
+                    records = self._reader.records(file)
+                yield FlashCard(*next(records))
+                expected = position + 1
+
+    def close(self) -> None:
+        self._offsets.release()
+        self._mmap.close()
+
+    def __enter__(self) -> IndexedSource:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    def _load(self, digest: bytes) -> bool:
+        """Map the index, if there is one that is up to date."""
+        try:
+            with self.index_filename.open("rb") as file:
+                index = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):  # ValueError: an empty file can't be mapped
+            return False
+
+        stat = self.filename.stat()
+        magic, index_digest, size, modified, count, map_size = _HEADER.unpack_from(index) if len(index) >= _HEADER.size else (b"",) * 6
+        if (magic, index_digest, size, modified) != (_MAGIC, digest, stat.st_size, stat.st_mtime_ns) or len(index) != _HEADER.size + 8 * count + map_size:
+            index.close()
+            return False
+
+        self._mmap = index
+        self._offsets = memoryview(index)[_HEADER.size : _HEADER.size + 8 * count].cast("Q")
+        self._map_start = _HEADER.size + 8 * count
+        self._index_map: dict[str, list[int]] | None = None
+        return True
+
+    def _build(self, digest: bytes) -> None:
+        """Read the whole file once and write the index next to it."""
+        stat = self.filename.stat()
+        offsets = array("Q")
+        index_map: dict[str, list[int]] = {}
+        with self.filename.open("rb") as file:
+            for offset, fields in self._reader.scan(file):
+                index_map.setdefault(fields[3] if len(fields) > 3 else "", []).append(len(offsets))
+                offsets.append(offset)
+
+        encoded_map = json.dumps(index_map, ensure_ascii=False).encode()
+        # Written next to the index and moved in place, so concurrent readers never see half an index
+        temporary = self.index_filename.with_name(f".{self.index_filename.name}.{os.getpid()}.tmp")
+        with temporary.open("wb") as file:
+            file.write(_HEADER.pack(_MAGIC, digest, stat.st_size, stat.st_mtime_ns, len(offsets), len(encoded_map)))
+            file.write(offsets.tobytes())
+            file.write(encoded_map)
+        temporary.replace(self.index_filename)
+
+
+class CardRange:
+    """Some of the cards of an ``IndexedSource``, read from the file only when they are needed."""
+
+    def __init__(self, source: IndexedSource, positions: Sequence[int]):
+        self.source = source
+        self.positions = positions
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @overload
+    def __getitem__(self, position: int) -> FlashCard: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> CardRange: ...
+
+    def __getitem__(self, position: int | slice) -> FlashCard | CardRange:
+        if isinstance(position, slice):
+            return CardRange(self.source, self.positions[position])
+        return self.source[self.positions[position]]
+
+    def __iter__(self) -> Iterator[FlashCard]:
+        return self.source.read(self.positions)
+
+
+class _CsvReader:
+    def __init__(self, filename: Path, *, delimiter: str = ",", columns: dict[str, str | int] | None = None, header: bool = True, encoding: str = "utf-8-sig"):
+        self.delimiter = delimiter
+        self.encoding = encoding
+        self.header = header
+        with filename.open(encoding=encoding, newline="") as file:
+            names = next(csv.reader(file, delimiter=delimiter), []) if header else None
+        self.positions = _column_positions(columns, names)
+
+    def scan(self, file: BinaryIO) -> Iterator[tuple[int, tuple[str, ...]]]:
+        """The offset and fields of every card, from the start of the file."""
+        position = 0
+
+        def lines() -> Iterator[str]:
+            nonlocal position
+            for line in file:
+                position += len(line)
+                yield line.decode(self.encoding)
+
+        rows = csv.reader(lines(), delimiter=self.delimiter)
+        if self.header:
+            next(rows, None)
+        while True:
+            start = position
+            row = next(rows, None)
+            if row is None:
+                return
+            if any(row):
+                yield start, _csv_fields(row, self.positions)
+
+    def records(self, file: BinaryIO) -> Iterator[tuple[str, ...]]:
+        """The fields of the cards from the current position of ``file`` on."""
+        for row in csv.reader((line.decode(self.encoding) for line in file), delimiter=self.delimiter):
+            if any(row):
+                yield _csv_fields(row, self.positions)
+
+
+class _JsonlReader:
+    def __init__(self, *, keys: dict[str, str] | None = None, encoding: str = "utf-8"):
+        self.names = _jsonl_keys(keys)
+        self.encoding = encoding
+
+    def scan(self, file: BinaryIO) -> Iterator[tuple[int, tuple[str, ...]]]:
+        position = 0
+        for number, line in enumerate(file, start=1):
+            if line.strip():
+                yield position, _jsonl_fields(line.decode(self.encoding), self.names, f"Line {number} of {file.name}")
+            position += len(line)
+
+    def records(self, file: BinaryIO) -> Iterator[tuple[str, ...]]:
+        for line in file:
+            if line.strip():
+                yield _jsonl_fields(line.decode(self.encoding), self.names, "A line")
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple
+
+from . import measure
+from .fitting import fit_text
+from .markup import font_for
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+    from reportlab.pdfgen.canvas import Canvas
+
+    from .markup import CardFace, Line, Markup
+
+EXTRA_FONT_SIZE = 8
+EXTRA_LEADING = 10
+INDEX_FONT_SIZE = 6
+# Face plans are memoized for repeats within a few dozen pages; the texts they are made of are memoized again below them
+FACE_PLANS = 4096
+
+
+class PlacedRun(NamedTuple):
+    """A run of text in its font, at its position relative to the bottom left corner of the card's content box."""
+
+    font: str
+    size: float
+    x: float
+    y: float
+    text: str
+    underline: float = 0  # Length of the underline; 0 for none
+
+
+class TextPlan(NamedTuple):
+    """How a block of text was fitted into its box."""
+
+    font_size: float
+    lines: tuple[Line, ...]
+    shrunk: bool  # Set below its font size to fit
+    overflowing: bool  # Doesn't fit, even at the minimum font size
+
+
+class FacePlan(NamedTuple):
+    """Everything drawn on one side of a card, worked out ahead of drawing; see ``plan_face()``."""
+
+    size: tuple[float, float]
+    main: TextPlan
+    extra: TextPlan | None
+    runs: tuple[PlacedRun, ...]
+    index_runs: int = 0  # How many of the runs, at the end, make up the index
+
+    @property
+    def texts(self) -> tuple[TextPlan, ...]:
+        return (self.main,) if self.extra is None else (self.main, self.extra)
+
+    @property
+    def body(self) -> tuple[PlacedRun, ...]:
+        """The runs of the main and extra texts; the same on every card with the same texts, whatever its index."""
+        return self.runs[: len(self.runs) - self.index_runs]
+
+    @property
+    def index(self) -> tuple[PlacedRun, ...]:
+        return self.runs[len(self.runs) - self.index_runs :]
+
+
+def plan_face(face: CardFace, font_name: str, font_size: float, leading: float, width: float, height: float) -> FacePlan:
+    """
+    Fit and place the texts of a card face in a ``width`` x ``height`` content box.
+
+    The main text is centered in the box above the room reserved for the extra text, which sits underneath it in a smaller
+    font; the index goes in the bottom right corner. The body of the plan comes from ``plan_body()``, so faces with the same
+    texts share it whatever their index; only the index is placed for every face.
+    """
+    body = plan_body(face.main, face.extra, font_name, font_size, leading, width, height)
+    if not any(face.index):
+        return body
+
+    runs = list(body.runs)
+    _place_line(runs, tuple(run for line in face.index for run in line), font_name, INDEX_FONT_SIZE, width - 2, 2, align="right")
+    return body._replace(runs=tuple(runs), index_runs=len(runs) - len(body.runs))
+
+
+@lru_cache(maxsize=FACE_PLANS)
+def plan_body(main: Markup, extra: Markup, font_name: str, font_size: float, leading: float, width: float, height: float) -> FacePlan:
+    """
+    The plan of a card face without an index: its main and extra texts fitted and placed.
+
+    Plans don't depend on where the box is, so identical texts (blank padding cards, the same word on many cards) share one
+    plan, on the front and on the back.
+    """
+    main_plan, extra_plan = fit_texts(main, extra, font_name, font_size, leading, width, height)
+
+    runs: list[PlacedRun] = []
+    _place_wrapped(runs, main_plan, font_name, leading, width / 2, height / 2)
+    if extra_plan is not None:
+        _place_wrapped(runs, extra_plan, font_name, EXTRA_LEADING, width / 2, 17)
+    return FacePlan((width, height), main_plan, extra_plan, tuple(runs))
+
+
+def fit_face(face: CardFace, font_name: str, font_size: float, leading: float, width: float, height: float) -> tuple[TextPlan, TextPlan | None]:
+    """Fit the main and extra (None without one) texts of a card face in a ``width`` x ``height`` content box, without placing them."""
+    return fit_texts(face.main, face.extra, font_name, font_size, leading, width, height)
+
+
+@lru_cache(maxsize=FACE_PLANS)
+def fit_texts(main: Markup, extra: Markup, font_name: str, font_size: float, leading: float, width: float, height: float) -> tuple[TextPlan, TextPlan | None]:
+    """``fit_face()`` for the texts themselves: fitting never looks at the index, so it isn't part of what is memoized."""
+    main_plan = _fit(main, font_name, font_size, leading, height - 2 * leading, width)
+    extra_plan = _fit(extra, font_name, EXTRA_FONT_SIZE, EXTRA_LEADING, leading, width) if any(extra) else None
+    return main_plan, extra_plan
+
+
+def draw_plan(canvas: Canvas, plan: FacePlan, x: float, y: float) -> None:
+    """Draw a planned card face with the bottom left corner of its content box at (x, y)."""
+    draw_runs(canvas, plan.runs, x, y)
+
+
+def draw_runs(canvas: Canvas, runs: Iterable[PlacedRun], x: float, y: float) -> None:
+    font = None
+    for run in runs:
+        if font != (run.font, run.size):
+            font = run.font, run.size
+            canvas.setFont(run.font, run.size)
+        canvas.drawString(x + run.x, y + run.y, run.text)
+        if run.underline:
+            canvas.line(x + run.x, y + run.y - 2, x + run.x + run.underline, y + run.y - 2)
+
+
+def _fit(text: Markup, font_name: str, font_size: float, leading: float, max_height: float, max_width: float) -> TextPlan:
+    fitted_size, lines = fit_text(text, font_name, font_size, leading, max_height, max_width)
+    return TextPlan(fitted_size, lines, fitted_size < font_size, len(lines) * leading > max_height)
+
+
+def _place_wrapped(runs: list[PlacedRun], text: TextPlan, font_name: str, leading: float, x: float, y: float) -> None:
+    """Place the lines of a fitted text centered around (x, y)."""
+    line_y = y + (len(text.lines) * leading / 2) - (leading / 2)
+    for line in text.lines:
+        _place_line(runs, line, font_name, text.font_size, x, line_y)
+        line_y -= leading
+
+
+def _place_line(runs: list[PlacedRun], line: Line, font_name: str, font_size: float, x: float, y: float, align: str = "center") -> None:
+    fonts = [font_for(font_name, run) for run in line]
+    widths = [measure.string_width(run.text, font, font_size) for run, font in zip(line, fonts)]  # noqa: B905
+
+    if align == "center":
+        x -= sum(widths) / 2
+    elif align == "right":
+        x -= sum(widths)
+
+    for run, font, width in zip(line, fonts, widths):  # noqa: B905
+        runs.append(PlacedRun(font, font_size, x, y, run.text, width if run.underline else 0))
+        x += width
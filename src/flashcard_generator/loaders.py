@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .generator import FlashCard
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator, Mapping, Sequence
+
+FIELDS = ("original", "translation", "extra", "index")
+REQUIRED_FIELDS = ("original", "translation")
+DECK_SUFFIXES = (".csv", ".tsv", ".tab", ".jsonl", ".ndjson")  # The files read_entries() can read
+
+
+def read_csv(
+    filename: str | Path,
+    *,
+    delimiter: str = ",",
+    columns: Mapping[str, str | int] | None = None,
+    header: bool = True,
+    encoding: str = "utf-8-sig",
+) -> Iterator[FlashCard]:
+    """
+    Read cards from a CSV file, one row at a time.
+
+    ``columns`` maps the card fields (original, translation, extra, index) to a column name from the header or a column
+    position. By default the columns are looked up by field name in the header, or taken in field order when there is no
+    header. Missing or empty columns become empty strings. The default encoding reads UTF-8 with or without the byte
+    order mark that e.g. Excel writes.
+    """
+    with Path(filename).open(encoding=encoding, newline="") as file:
+        rows = csv.reader(file, delimiter=delimiter)
+        names = next(rows, []) if header else None
+        positions = _column_positions(columns, names)
+
+        for row in rows:
+            if not any(row):
+                continue
+            yield FlashCard(*_csv_fields(row, positions))
+
+
+def read_tsv(
+    filename: str | Path,
+    *,
+    columns: Mapping[str, str | int] | None = None,
+    header: bool = True,
+    encoding: str = "utf-8-sig",
+) -> Iterator[FlashCard]:
+    """Read cards from a tab separated file; see ``read_csv()``."""
+    return read_csv(filename, delimiter="\t", columns=columns, header=header, encoding=encoding)
+
+
+def read_jsonl(filename: str | Path, *, keys: Mapping[str, str] | None = None, encoding: str = "utf-8") -> Iterator[FlashCard]:
+    """
+    Read cards from a JSON Lines file, one line at a time.
+
+    Every line is an object, with the card fields as keys unless ``keys`` maps them to other ones, or an array with the
+    fields in order. Blank lines are skipped.
+    """
+    names = _jsonl_keys(keys)
+
+    with Path(filename).open(encoding=encoding) as file:
+        for number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            yield FlashCard(*_jsonl_fields(line, names, f"Line {number} of {filename}"))
+
+
+def read_entries(filename: str | Path, **options: Any) -> Iterator[FlashCard]:
+    """Read cards from a ``.csv``, ``.tsv`` (or ``.tab``) or ``.jsonl`` file, picking the loader by extension."""
+    suffix = Path(filename).suffix.lower()
+    if suffix == ".csv":
+        return read_csv(filename, **options)
+    if suffix in (".tsv", ".tab"):
+        return read_tsv(filename, **options)
+    if suffix in (".jsonl", ".ndjson"):
+        return read_jsonl(filename, **options)
+    raise ValueError(f"Unknown deck format '{suffix}', expected .csv, .tsv or .jsonl")
+
+
+def _csv_fields(row: Sequence[str], positions: Sequence[int | None]) -> tuple[str, ...]:
+    """The card fields in a CSV row; missing columns become empty strings."""
+    return tuple(row[position] if position is not None and position < len(row) else "" for position in positions)
+
+
+def _jsonl_keys(keys: Mapping[str, str] | None) -> dict[str, str]:
+    return {field: (keys or {}).get(field, field) for field in FIELDS}
+
+
+def _jsonl_fields(line: str | bytes, names: Mapping[str, str], where: str) -> tuple[str, ...]:
+    """The card fields in a JSON Lines record; ``where`` says which one it is in errors."""
+    record = json.loads(line)
+    if isinstance(record, list):
+        if len(record) < len(REQUIRED_FIELDS):
+            raise ValueError(f"{where} has {len(record)} field(s), expected at least {len(REQUIRED_FIELDS)}")
+        return tuple(_jsonl_text(value) for value in record[: len(FIELDS)])
+    if isinstance(record, dict):
+        missing = [names[field] for field in REQUIRED_FIELDS if names[field] not in record]
+        if missing:
+            raise ValueError(f"{where} has no {', '.join(missing)}")
+        return tuple(_jsonl_text(record.get(names[field])) for field in FIELDS)
+    raise TypeError(f"{where} is not a JSON object or array")
+
+
+def _jsonl_text(value: Any) -> str:
+    """A JSON value as card text; ``null`` is an empty field, not "None"."""
+    return "" if value is None else str(value)
+
+
+def _column_positions(columns: Mapping[str, str | int] | None, header: Sequence[str] | None) -> list[int | None]:
+    """The column position of every card field, None for fields that aren't in the file."""
+    if columns is None:
+        columns = {field: field if header is not None else position for position, field in enumerate(FIELDS)}
+
+    unknown = set(columns) - set(FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown card field(s): {', '.join(sorted(unknown))}")
+
+    positions: list[int | None] = []
+    for field in FIELDS:
+        column = columns.get(field)
+        if isinstance(column, str):
+            if header is None:
+                raise ValueError(f"Column '{column}' can only be looked up in a file with a header")
+            position = header.index(column) if column in header else None
+        else:
+            position = column
+        if position is None and field in REQUIRED_FIELDS:
+            raise ValueError(f"No column for the {field}")
+        positions.append(position)
+    return positions
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple
+
+_TAG = re.compile(r"(<[^>]+>)")
+
+# Tag -> (attribute, value) it switches on or off
+_TAGS = {
+    "<b>": ("bold", True),
+    "</b>": ("bold", False),
+    "<i>": ("italic", True),
+    "</i>": ("italic", False),
+    "<u>": ("underline", True),
+    "</u>": ("underline", False),
+}
+
+
+class Run(NamedTuple):
+    """A piece of text in a single style."""
+
+    text: str
+    bold: bool = False
+    italic: bool = False
+    underline: bool = False
+
+    @property
+    def style(self) -> tuple[bool, bool, bool]:
+        return self.bold, self.italic, self.underline
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    Line = tuple[Run, ...]
+    Markup = tuple[Line, ...]
+
+
+class CardFace(NamedTuple):
+    """Everything drawn on one side of a card: the main text, a smaller extra line and an index in the corner."""
+
+    main: Markup
+    extra: Markup = ()
+    index: Markup = ()
+
+
+@lru_cache(maxsize=65536)
+def parse_markup(text: str) -> Markup:
+    """
+    Parse ``<b>``, ``<i>``, ``<u>`` and ``<br/>`` tags into lines of runs.
+
+    Newlines break lines just like ``<br/>``. Styles carry over line breaks until they are closed; other tags are dropped.
+    Identical texts share the parsed result.
+    """
+    lines: list[Line] = []
+    runs: list[Run] = []
+    style = {"bold": False, "italic": False, "underline": False}
+
+    for fragment in _TAG.split(text):
+        if fragment == "<br/>":
+            lines.append(tuple(runs))
+            runs = []
+        elif fragment.startswith("<"):
+            if fragment in _TAGS:
+                attribute, value = _TAGS[fragment]
+                style[attribute] = value
+        else:
+            first, *rest = fragment.split("\n")
+            if first:
+                runs.append(Run(first, **style))
+            for part in rest:
+                lines.append(tuple(runs))
+                runs = [Run(part, **style)] if part else []
+
+    lines.append(tuple(runs))
+    return tuple(lines)
+
+
+def front_face(original: str, extra: str, index: str) -> CardFace:
+    # Without an extra, the front is the same face as a back with the same text, so both share a plan
+    return CardFace(parse_markup(original), parse_markup(extra) if extra else (), parse_markup(index))
+
+
+def back_face(translation: str, index: str) -> CardFace:
+    return CardFace(parse_markup(translation), index=parse_markup(index))
+
+
+def font_for(base_font: str, run: Run) -> str:
+    """The font variation of ``base_font`` a run is set in."""
+    if run.bold and run.italic:
+        return f"{base_font}-BoldOblique"
+    if run.bold:
+        return f"{base_font}-Bold"
+    if run.italic:
+        return f"{base_font}-Oblique"
+    return base_font
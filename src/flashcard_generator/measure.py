@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+from .fonts import ensure_font
+from .markup import Run, font_for
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Iterator
+
+    from .markup import Line
+
+_WHITESPACE = re.compile(r"(\s+)")
+
+
+@lru_cache(maxsize=64)
+def glyph_advances(font_name: str) -> tuple[Callable[[int, float], float], float] | None:
+    """
+    The glyph advance table of a TrueType font: a lookup from code point to width (in 1/1000 em), and the default width.
+
+    Returns None for other fonts, whose widths are left to reportlab.
+    """
+    ensure_font(font_name)
+    font = pdfmetrics.getFont(font_name)
+    if not isinstance(font, TTFont):
+        return None
+    return font.face.charWidths.get, font.face.defaultWidth
+
+
+@lru_cache(maxsize=65536)
+def string_width(text: str, font_name: str, font_size: float) -> float:
+    """
+    Width of ``text`` in points, same as ``pdfmetrics.stringWidth``.
+
+    Results are memoized per (text, font, size) with LRU eviction; ``string_width.cache_info()`` reports the hits and misses.
+    """
+    advances = glyph_advances(font_name)
+    if advances is None:
+        return pdfmetrics.stringWidth(text, font_name, font_size)
+
+    advance, default_width = advances
+    return 0.001 * font_size * sum(advance(ord(char), default_width) for char in text)
+
+
+def line_width(line: Line, base_font: str, font_size: float) -> float:
+    """Total width of a line of runs, each measured in its own font."""
+    return sum(string_width(run.text, font_for(base_font, run), font_size) for run in line)
+
+
+def split_line(line: Line, base_font: str, font_size: float, max_width: float) -> list[Line]:
+    """
+    Greedy word wrapping of a line of runs to ``max_width``.
+
+    Lines are broken at whitespace exactly like ``reportlab.lib.utils.simpleSplit`` does, but every run is measured in its own font
+    and the markup itself takes up no room.
+    """
+    lines: list[Line] = []
+    current: list[Run] = []
+    width = 0.0
+
+    for separator, word in _words(line):
+        word_width = line_width(word, base_font, font_size)
+        if not current:
+            current, width = list(word), word_width
+            continue
+
+        space_width = string_width(" ", font_for(base_font, separator), font_size)
+        if width + space_width + word_width <= max_width:
+            current.append(separator._replace(text=" "))
+            current.extend(word)
+            width = width + space_width + word_width
+        else:
+            lines.append(_merge(current))
+            current, width = list(word), word_width
+
+    if current:
+        lines.append(_merge(current))
+
+    return lines
+
+
+def _words(line: Line) -> Iterator[tuple[Run, list[Run]]]:
+    """Split a line of runs into words, each with the run holding the whitespace before it."""
+    separator = Run(" ")
+    word: list[Run] = []
+
+    for run in line:
+        for part in _WHITESPACE.split(run.text):
+            if not part:
+                continue
+            if part.isspace():
+                if word:
+                    yield separator, word
+                    word = []
+                separator = run
+            else:
+                word.append(run._replace(text=part))
+
+    if word:
+        yield separator, word
+
+
+def _merge(runs: list[Run]) -> Line:
+    """Join adjacent runs that have the same style."""
+    merged: list[Run] = []
+    for run in runs:
+        if merged and merged[-1].style == run.style:
+            merged[-1] = merged[-1]._replace(text=merged[-1].text + run.text)
+        else:
+            merged.append(run)
+    return tuple(merged)
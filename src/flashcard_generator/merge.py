@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import re
+import zlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+    from typing import BinaryIO
+
+_STARTXREF = re.compile(rb"startxref\s+(\d+)\s+%%EOF\s*$")
+_SUBSECTION = re.compile(rb"\s*(\d+) (\d+)[ \t]*\r?\n")
+_OBJECT_HEADER = re.compile(rb"\d+ \d+ obj\s*")
+_STREAM = re.compile(rb">>\s*(stream\r?\n)")
+_REFERENCE = re.compile(rb"(\d+) 0 R\b")
+_SUBSET_TAG = re.compile(rb"/([A-Z]{6})\+")
+_ROOT = re.compile(rb"/Root (\d+) 0 R")
+_INFO = re.compile(rb"/Info (\d+) 0 R")
+_PAGES = re.compile(rb"/Pages (\d+) 0 R")
+_KIDS = re.compile(rb"/Kids\s*\[([^\]]*)\]")
+_FILTER = re.compile(rb"/Filter \[ (/ASCII85Decode )?/FlateDecode \]")
+_LENGTH = re.compile(rb"/Length (\d+)")
+
+# Object numbers reserved in the merged document
+_PAGES_ROOT = 1
+_CATALOG = 2
+_INFO_OBJECT = 3
+
+
+@dataclass
+class PdfDocument:
+    """The objects of a PDF document, split in their dictionary and (binary) stream part."""
+
+    objects: dict[int, tuple[bytes, bytes]]
+    root: int
+    info: int | None
+
+    def page_tree(self) -> tuple[list[int], set[int]]:
+        """The page objects in page order, and the intermediate page tree nodes they hang off."""
+        pages: list[int] = []
+        nodes: set[int] = set()
+
+        def walk(number: int) -> None:
+            head = self.objects[number][0]
+            kids = _KIDS.search(head)
+            if b"/Type /Pages" in head and kids is not None:
+                nodes.add(number)
+                for kid in _REFERENCE.finditer(kids[1]):
+                    walk(int(kid[1]))
+            else:
+                pages.append(number)
+
+        walk(int(_PAGES.search(self.objects[self.root][0])[1]))
+        return pages, nodes
+
+
+def parse_pdf(document: bytes) -> PdfDocument:
+    """
+    Split a PDF document as written by reportlab into its objects.
+
+    This is not a general PDF parser: it expects a classic cross-reference table and no object streams or incremental updates.
+    """
+    startxref = _STARTXREF.search(document)
+    if startxref is None or not document.startswith(b"%PDF-"):
+        raise ValueError("Not a PDF document")
+
+    position = int(startxref[1])
+    if document[position : position + 4] != b"xref":
+        raise ValueError("Only PDF documents with a cross-reference table are supported")
+    position += 4
+
+    offsets: dict[int, int] = {}
+    while True:
+        subsection = _SUBSECTION.match(document, position)
+        if subsection is None:
+            break
+        first, count = int(subsection[1]), int(subsection[2])
+        position = subsection.end()
+        for number in range(first, first + count):
+            offset, _, kind = document[position : position + 20].split()[:3]
+            if kind == b"n":
+                offsets[number] = int(offset)
+            position += 20
+
+    trailer = document[position:]
+    root = _ROOT.search(trailer)
+    if root is None:
+        raise ValueError("PDF document has no /Root")
+    info = _INFO.search(trailer)
+
+    # Every object runs up to where the next one (or the cross-reference table) starts
+    starts = sorted((offset, number) for number, offset in offsets.items())
+    ends = [offset for offset, _ in starts[1:]] + [int(startxref[1])]
+
+    objects = {}
+    for (start, number), end in zip(starts, ends):  # noqa: B905  # zip(strict=) needs Python 3.10
+        body = document[start:end]
+        body = body[_OBJECT_HEADER.match(body).end() : body.rindex(b"endobj")]
+
+        stream = _STREAM.search(body)
+        if stream is None:
+            objects[number] = (body.rstrip(), b"")
+        else:
+            objects[number] = (body[: stream.start(1)].rstrip(), body[stream.start(1) :].rstrip())
+
+    return PdfDocument(objects, int(root[1]), None if info is None else int(info[1]))
+
+
+class PdfMerger:
+    """
+    Concatenates the pages of PDF documents written by reportlab into a single document.
+
+    Documents are written out as soon as they are added, so only the document being added is held in memory. With
+    ``compact``, every compressed stream is written as binary (without the ASCII85 encoding reportlab puts around page
+    contents) and compressed again at the highest level.
+    """
+
+    def __init__(self, stream: BinaryIO, *, compact: bool = False):
+        self._stream = stream
+        self._compact = compact
+        self._position = 0
+        self._digest = hashlib.md5()  # Only used for the document ID
+        self._offsets: dict[int, int] = {}
+        self._next_number = _INFO_OBJECT + 1
+        self._kids: list[int] = []
+        self._tags = 0
+        self._written: dict[bytes, int] = {}  # Object digest -> its number in the merged document
+        self._unique = 0
+        self._write(b"%PDF-1.4\n%\x93\x8c\x8b\x9e ReportLab Generated PDF document\n")
+
+    def add(self, document: bytes | PdfDocument, pages: Iterable[int] | None = None) -> None:
+        """
+        Append the pages of ``document``, or only the ``pages`` at those (0-based) positions.
+
+        Objects identical to ones already written, like the fonts of pages cut from the same document, are shared instead
+        of written again.
+        """
+        pdf = document if isinstance(document, PdfDocument) else parse_pdf(document)
+        all_pages, nodes = pdf.page_tree()
+        selected = all_pages if pages is None else [all_pages[position] for position in pages]
+
+        carried = self._reachable(pdf, selected, nodes)
+        digests = self._digests(pdf, carried, set(selected), nodes)
+
+        numbers = dict.fromkeys(nodes, _PAGES_ROOT)  # Every page now hangs off the merged page tree
+        new = []
+        for number in sorted(carried):
+            if digests[number] in self._written:
+                numbers[number] = self._written[digests[number]]
+            else:
+                numbers[number] = self._written[digests[number]] = self._next_number
+                self._next_number += 1
+                new.append(number)
+
+        # Subset tags only have to be unique within a document, so give every subset a new one
+        tags: dict[bytes, bytes] = {}
+
+        def renumber(match: re.Match) -> bytes:
+            if int(match[1]) not in numbers:
+                raise ValueError(f"Object {int(match[1])} can't be carried over into the merged document")
+            return b"%d 0 R" % numbers[int(match[1])]
+
+        def retag(match: re.Match) -> bytes:
+            if match[1] not in tags:
+                tags[match[1]] = self._new_tag()
+            return b"/" + tags[match[1]] + b"+"
+
+        for number in new:
+            head, stream = pdf.objects[number]
+            head = _SUBSET_TAG.sub(retag, _REFERENCE.sub(renumber, head))
+            if self._compact:
+                head, stream = _compact_stream(head, stream)
+            self._write_object(numbers[number], head, stream)
+
+        if pdf.info is not None and _INFO_OBJECT not in self._offsets:
+            self._write_object(_INFO_OBJECT, *pdf.objects[pdf.info])
+
+        self._kids.extend(numbers[page] for page in selected)
+
+    @staticmethod
+    def _reachable(pdf: PdfDocument, pages: list[int], nodes: set[int]) -> set[int]:
+        """The objects the ``pages`` need, leaving out the page tree."""
+        reachable: set[int] = set()
+        todo = list(pages)
+        while todo:
+            number = todo.pop()
+            if number in reachable or number in nodes:
+                continue
+            reachable.add(number)
+            todo.extend(int(reference[1]) for reference in _REFERENCE.finditer(pdf.objects[number][0]))
+        return reachable
+
+    def _digests(self, pdf: PdfDocument, carried: set[int], pages: set[int], nodes: set[int]) -> dict[int, bytes]:
+        """A hash of every carried object, including everything it refers to, to recognise objects already written."""
+        digests: dict[int, bytes] = {}
+        in_progress: set[int] = set()
+
+        def unique() -> bytes:
+            self._unique += 1
+            return b"unique %d" % self._unique
+
+        def digest(number: int) -> bytes:
+            if number in nodes:
+                return b"pages"
+            if number in digests:
+                return digests[number]
+            if number in in_progress or number in pages:
+                # Pages are never shared (a page can't be in the page tree twice), nor is anything that refers back to itself
+                digests[number] = unique()
+                return digests[number]
+
+            in_progress.add(number)
+            head, stream = pdf.objects[number]
+            head = _REFERENCE.sub(lambda match: b"<" + digest(int(match[1])) + b">", head)
+            digests.setdefault(number, hashlib.sha256(head + stream).hexdigest().encode())
+            in_progress.discard(number)
+            return digests[number]
+
+        for number in sorted(carried):
+            digest(number)
+        return digests
+
+    @property
+    def pages(self) -> int:
+        """The number of pages added so far."""
+        return len(self._kids)
+
+    def close(self) -> None:
+        kids = b" ".join(b"%d 0 R" % kid for kid in self._kids)
+        self._write_object(_PAGES_ROOT, b"<<\n/Count %d /Kids [ %s ] /Type /Pages\n>>" % (len(self._kids), kids))
+        self._write_object(_CATALOG, b"<<\n/PageMode /UseNone /Pages %d 0 R /Type /Catalog\n>>" % _PAGES_ROOT)
+        if _INFO_OBJECT not in self._offsets:
+            self._write_object(_INFO_OBJECT, b"<<\n/Producer (flashcard_generator)\n>>")
+
+        startxref = self._position
+        size = self._next_number
+        xref = [b"xref\n0 %d\n" % size, b"0000000000 65535 f \n"]
+        for number in range(1, size):
+            xref.append(b"%010d 00000 n \n" % self._offsets[number])
+        self._write(b"".join(xref))
+
+        document_id = self._digest.hexdigest().encode()
+        self._write(
+            b"trailer\n<<\n/ID [<%s><%s>]\n/Info %d 0 R\n/Root %d 0 R\n/Size %d\n>>\nstartxref\n%d\n%%%%EOF\n"
+            % (document_id, document_id, _INFO_OBJECT, _CATALOG, size, startxref)
+        )
+
+    def _new_tag(self) -> bytes:
+        number, tag = self._tags, []
+        self._tags += 1
+        for _ in range(6):
+            number, letter = divmod(number, 26)
+            tag.append(65 + letter)
+        return bytes(reversed(tag))
+
+    def _write_object(self, number: int, head: bytes, stream: bytes = b"") -> None:
+        self._offsets[number] = self._position
+        self._write(b"%d 0 obj\n%s\n%s%sendobj\n" % (number, head, stream, b"\n" if stream else b""))
+
+    def _write(self, data: bytes) -> None:
+        self._stream.write(data)
+        self._digest.update(data)
+        self._position += len(data)
+
+
+def _compact_stream(head: bytes, stream: bytes) -> tuple[bytes, bytes]:
+    """Decode a compressed stream and compress it again, as tightly as zlib goes and without ASCII85."""
+    filters = _FILTER.search(head)
+    if filters is None:
+        return head, stream
+
+    start = stream.index(b"\n") + 1
+    data = stream[start : start + int(_LENGTH.search(head)[1])]
+    if filters[1]:
+        data = base64.a85decode(data, adobe=True)
+    data = zlib.compress(zlib.decompress(data), 9)
+
+    head = _LENGTH.sub(b"/Length %d" % len(data), _FILTER.sub(b"/Filter [ /FlateDecode ]", head))
+    return head, b"stream\n" + data + b"\nendstream"
+
+
+def merge_pdfs(documents: Iterable[bytes], stream: BinaryIO) -> None:
+    """Write the pages of all ``documents`` (written by reportlab), in order, as a single PDF document to ``stream``."""
+    merger = PdfMerger(stream)
+    for document in documents:
+        merger.add(document)
+    merger.close()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .deck import CardView
+    from .generator import FlashCard
+    from .layout import TextPlan
+
+
+class CardReport(NamedTuple):
+    """How the texts of a card fit on it: their font sizes, and whether they had to shrink or still overflow."""
+
+    position: int  # In the deck, from 0
+    page: int  # The page its front is printed on, from 1; the back is on the next page
+    card: FlashCard | CardView
+    front: TextPlan
+    extra: TextPlan | None
+    back: TextPlan
+
+    @property
+    def texts(self) -> tuple[TextPlan, ...]:
+        return (self.front, self.back) if self.extra is None else (self.front, self.extra, self.back)
+
+    @property
+    def shrunk(self) -> bool:
+        return any(text.shrunk for text in self.texts)
+
+    @property
+    def overflowing(self) -> bool:
+        return any(text.overflowing for text in self.texts)
+
+
+@dataclass
+class PreflightReport:
+    """What generating a deck would print, worked out without drawing anything; see ``FlashCardGenerator.preflight()``."""
+
+    cards: list[CardReport] = field(default_factory=list)
+    pages: int = 0
+
+    @property
+    def shrunk(self) -> list[CardReport]:
+        return [card for card in self.cards if card.shrunk]
+
+    @property
+    def overflowing(self) -> list[CardReport]:
+        return [card for card in self.cards if card.overflowing]
+
+    @property
+    def ok(self) -> bool:
+        """Whether every text fits on its card."""
+        return not any(card.overflowing for card in self.cards)
+
+    def summary(self) -> str:
+        """A line with the totals, followed by a line for every card with a text that doesn't fit."""
+        overflowing = self.overflowing
+        lines = [f"{len(self.cards)} cards on {self.pages} pages: {len(self.shrunk)} shrunk, {len(overflowing)} overflowing"]
+        for card in overflowing:
+            sides = [side for side, text in (("front", card.front), ("extra", card.extra), ("back", card.back)) if text is not None and text.overflowing]
+            index = f" (index {card.card.index})" if card.card.index else ""
+            lines.append(f"card {card.position + 1}{index} on page {card.page}: {', '.join(sides)} overflowing: {card.card.original!r}")
+        return "\n".join(lines)
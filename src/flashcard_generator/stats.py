@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
+PHASES = ("read", "layout", "fit", "draw", "write")
+
+_current: ContextVar[GenerationStats | None] = ContextVar("flashcard_generator_stats", default=None)
+
+
+@dataclass
+class GenerationStats:
+    """
+    Where the time went while generating a deck, and what came out.
+
+    ``seconds`` holds the wall time per phase, each excluding the phases nested in it:
+
+    - ``read``: pulling the cards from the entries (with ``generate_stream`` this includes building and parsing them)
+    - ``layout``: arranging the cards on the pages
+    - ``fit``: wrapping the texts and finding the font size they fit at
+    - ``draw``: drawing the cards and the grid
+    - ``write``: everything else, mostly reportlab laying out and writing the document (and merging, for parallel builds)
+
+    With parallel workers, the phases add up the time spent in every worker.
+    """
+
+    seconds: dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    fit_attempts: int = 0  # Wrap attempts made by the fit solver; texts fitted before take none
+    texts_fitted: int = 0
+    texts_shrunk: int = 0  # Texts set below their font size to fit
+    texts_overflowing: int = 0  # Texts that still don't fit at the minimum font size
+    pages: int = 0
+    output_bytes: int = 0
+    _running: list[list[float]] = field(default_factory=list, repr=False, compare=False)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.seconds.values())
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase, leaving out the time of phases started inside it."""
+        running = [time.perf_counter(), 0.0]  # Start, time spent in nested phases
+        self._running.append(running)
+        try:
+            yield
+        finally:
+            self._running.pop()
+            elapsed = time.perf_counter() - running[0]
+            self.seconds[name] = self.seconds.get(name, 0.0) + elapsed - running[1]
+            if self._running:
+                self._running[-1][1] += elapsed
+
+    def add(self, other: GenerationStats) -> None:
+        """Add the phases and counters of ``other``; pages and bytes are left alone, as they are counted on the output."""
+        for name, seconds in other.seconds.items():
+            self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+        self.fit_attempts += other.fit_attempts
+        self.texts_fitted += other.texts_fitted
+        self.texts_shrunk += other.texts_shrunk
+        self.texts_overflowing += other.texts_overflowing
+
+    def __getstate__(self) -> dict:
+        return {**self.__dict__, "_running": []}
+
+
+def current_stats() -> GenerationStats | None:
+    """The statistics being collected in this context, if any."""
+    return _current.get()
+
+
+@contextmanager
+def collecting(stats: GenerationStats | None) -> Iterator[GenerationStats | None]:
+    """Collect statistics in ``stats`` for everything run inside; None collects nothing."""
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a phase in the statistics being collected; does nothing when none are."""
+    stats = _current.get()
+    if stats is None:
+        yield
+    else:
+        with stats.phase(name):
+            yield
+
+
+def timed(name: str, items: Iterable) -> Iterable:
+    """Count the time spent producing ``items`` towards a phase, when statistics are being collected."""
+    stats = _current.get()
+    if stats is None:
+        return items
+    return _timed(stats, name, iter(items))
+
+
+def _timed(stats: GenerationStats, name: str, items: Iterator) -> Iterator:
+    while True:
+        with stats.phase(name):
+            item = next(items, _timed)
+        if item is _timed:
+            return
+        yield item
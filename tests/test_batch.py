@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from flashcard_generator import DeckJob, build_decks, find_decks, read_manifest
+from flashcard_generator.batch import format_summary, main
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def decks(tmp_path: Path) -> Path:
+    directory = tmp_path / "decks"
+    directory.mkdir()
+    (directory / "latin.csv").write_text("original,translation\n**amicus**,de vriend\ndeus,de god\n", encoding="utf-8")
+    (directory / "greek.jsonl").write_text('{"original": "θεός", "translation": "god"}\n' * 130, encoding="utf-8")
+    (directory / "notes.txt").write_text("not a deck", encoding="utf-8")
+    return directory
+
+
+def test_find_decks(decks: Path, tmp_path: Path) -> None:
+    jobs = find_decks(decks, tmp_path / "build", engine="canvas")
+
+    assert jobs == [
+        DeckJob(decks / "greek.jsonl", tmp_path / "build" / "greek.pdf", {"engine": "canvas"}),
+        DeckJob(decks / "latin.csv", tmp_path / "build" / "latin.pdf", {"engine": "canvas"}),
+    ]
+
+
+def test_read_manifest(decks: Path) -> None:
+    manifest = decks / "decks.json"
+    manifest.write_text(
+        json.dumps(
+            {
+                "output": "build",
+                "options": {"engine": "canvas", "profile": "compact"},
+                "decks": ["latin.csv", {"source": "greek.jsonl", "output": "grieks.pdf", "options": {"cards_per_row": 3}, "loader": {"keys": {}}}],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    assert read_manifest(manifest) == [
+        DeckJob(decks / "latin.csv", decks / "build" / "latin.pdf", {"engine": "canvas", "profile": "compact"}),
+        DeckJob(decks / "greek.jsonl", decks / "build" / "grieks.pdf", {"engine": "canvas", "profile": "compact", "cards_per_row": 3}, {"keys": {}}),
+    ]
+
+
+def test_read_manifest_with_options(decks: Path, tmp_path: Path) -> None:
+    manifest = decks / "decks.json"
+    manifest.write_text(
+        json.dumps({"options": {"engine": "canvas"}, "decks": ["latin.csv", {"source": "greek.jsonl", "options": {"profile": "fast"}}]}), encoding="utf-8"
+    )
+
+    assert read_manifest(manifest, tmp_path / "build", profile="compact") == [
+        DeckJob(decks / "latin.csv", tmp_path / "build" / "latin.pdf", {"engine": "canvas", "profile": "compact"}),
+        DeckJob(decks / "greek.jsonl", tmp_path / "build" / "greek.pdf", {"engine": "canvas", "profile": "fast"}),
+    ]
+
+
+def test_read_manifest_cache_is_relative_to_the_manifest(decks: Path) -> None:
+    manifest = decks / "decks.json"
+    manifest.write_text(
+        json.dumps(
+            {"options": {"cache": ".cache"}, "decks": ["latin.csv", {"source": "greek.jsonl", "options": {"cache": {"directory": "greek", "max_size": 1}}}]}
+        ),
+        encoding="utf-8",
+    )
+
+    latin, greek = read_manifest(manifest)
+    assert latin.options == {"cache": decks / ".cache"}
+    assert greek.options == {"cache": {"directory": decks / "greek", "max_size": 1}}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_build_decks(decks: Path, tmp_path: Path, workers: int) -> None:
+    jobs = [*find_decks(decks, tmp_path / "build", engine="canvas"), DeckJob(decks / "notes.txt", tmp_path / "build" / "notes.pdf")]
+
+    results = list(build_decks(jobs, workers=workers))
+
+    assert [result.job for result in results] == jobs
+    greek, latin, notes = results
+    assert (greek.cards, greek.pages) == (130, 6)
+    assert (latin.cards, latin.pages) == (2, 2)
+    assert latin.output_bytes == (tmp_path / "build" / "latin.pdf").stat().st_size
+    assert greek.ok
+    assert latin.ok
+    assert not notes.ok
+    assert notes.error == "ValueError: Unknown deck format '.txt', expected .csv, .tsv or .jsonl"
+
+    summary = format_summary(results, 1.5)
+    assert "FAILED" in summary
+    assert summary.endswith("2 decks built, 1 failed in 1.50s")
+
+
+def test_build_deck_with_unknown_option(decks: Path, tmp_path: Path) -> None:
+    (result,) = build_decks([DeckJob(decks / "latin.csv", tmp_path / "latin.pdf", {"colour": "red"})])
+
+    assert result.error == "ValueError: Unknown generator option 'colour'"
+
+
+def test_build_deck_with_forms(decks: Path, tmp_path: Path) -> None:
+    (result,) = build_decks([DeckJob(decks / "greek.jsonl", tmp_path / "greek.pdf", {"engine": "canvas", "forms": True})])
+
+    assert result.ok, result.error
+    assert b"/Subtype /Form" in (tmp_path / "greek.pdf").read_bytes()
+
+
+def test_build_deck_with_filename_option(decks: Path, tmp_path: Path) -> None:
+    (result,) = build_decks([DeckJob(decks / "latin.csv", tmp_path / "latin.pdf", {"filename": "elsewhere.pdf"})])
+
+    assert result.error == "ValueError: The 'filename' option can't be set, the output of a deck is set by its job"
+    assert not (tmp_path / "latin.pdf").exists()
+
+
+def test_build_deck_failure_keeps_the_last_pdf(decks: Path, tmp_path: Path) -> None:
+    output = tmp_path / "greek.pdf"
+    output.write_bytes(b"%PDF-1.4 last good build")
+    with (decks / "greek.jsonl").open("a", encoding="utf-8") as file:
+        file.write("not json\n")
+
+    (result,) = build_decks([DeckJob(decks / "greek.jsonl", output)])
+
+    assert not result.ok
+    assert output.read_bytes() == b"%PDF-1.4 last good build"
+    assert list(tmp_path.glob(".*.tmp")) == []
+
+
+def test_main(decks: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main([str(decks), "--output", str(tmp_path / "build"), "--workers", "1", "--engine", "canvas"]) == 0
+
+    assert (tmp_path / "build" / "latin.pdf").exists()
+    assert (tmp_path / "build" / "greek.pdf").exists()
+    assert "2 decks built, 0 failed" in capsys.readouterr().out
+
+
+def test_main_fails_with_a_failed_deck(decks: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    manifest = decks / "decks.json"
+    manifest.write_text(json.dumps({"decks": ["latin.csv", "notes.txt"]}), encoding="utf-8")
+
+    assert main([str(manifest), "--workers", "1"]) == 1
+    assert (decks / "latin.pdf").exists()
+    assert "1 decks built, 1 failed" in capsys.readouterr().out
+
+
+def test_main_with_manifest_options(decks: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    manifest = decks / "decks.json"
+    manifest.write_text(json.dumps({"decks": ["latin.csv"]}), encoding="utf-8")
+    built = []
+    monkeypatch.setattr("flashcard_generator.batch.build_decks", lambda jobs, workers: built.extend(jobs) or [])
+
+    assert main([str(manifest), "--output", str(tmp_path), "--engine", "canvas", "--profile", "fast"]) == 0
+    assert built == [DeckJob(decks / "latin.csv", tmp_path / "latin.pdf", {"engine": "canvas", "profile": "fast"})]
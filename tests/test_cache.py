@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+from reportlab import rl_config
+
+from flashcard_generator import FlashCardGenerator
+from flashcard_generator.cache import PageCache
+from flashcard_generator.merge import parse_pdf
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+CARDS_PER_PAGE = 60
+
+
+@pytest.fixture
+def rendered(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """The number of cards in every document rendered (as opposed to taken from the cache)."""
+    counts: list[int] = []
+    render_canvas = FlashCardGenerator._render_canvas
+
+    def record(self: FlashCardGenerator, entries: list, output: object) -> None:
+        counts.append(len(entries))
+        render_canvas(self, entries, output)
+
+    monkeypatch.setattr(FlashCardGenerator, "_render_canvas", record)
+    monkeypatch.setattr(rl_config, "invariant", 1)
+    return counts
+
+
+def _generate(tmp_path: Path, cards: int = 130, edit: int | None = None, card_height: float | None = None) -> bytes:
+    fcg = FlashCardGenerator().set_filename(tmp_path / "deck.pdf").set_engine("canvas").set_cache(tmp_path / "cache")
+    if card_height is not None:
+        fcg.set_card_height(card_height)
+    for i in range(cards):
+        fcg.add_entry("changed" if i == edit else f"**word {i}**", f"woord {i}", "*extra*", str(i))
+    fcg.generate()
+    return fcg.filename.read_bytes()
+
+
+def test_rebuild_reuses_pages(tmp_path: Path, rendered: list[int]) -> None:
+    first = _generate(tmp_path)
+    assert rendered == [130]
+
+    assert _generate(tmp_path) == first
+    assert rendered == [130]
+
+
+def test_changed_card_renders_its_page_only(tmp_path: Path, rendered: list[int]) -> None:
+    _generate(tmp_path, 1000)
+    rendered.clear()
+
+    edited = _generate(tmp_path, 1000, edit=700)
+
+    assert rendered == [CARDS_PER_PAGE]
+    pages, _ = parse_pdf(edited).page_tree()
+    assert len(pages) == 34
+
+
+def test_layout_change_renders_everything(tmp_path: Path, rendered: list[int]) -> None:
+    _generate(tmp_path)
+    _generate(tmp_path, card_height=80)
+
+    assert rendered == [130, 130]
+
+
+def test_output_size_matches_uncached(tmp_path: Path, rendered: list[int]) -> None:
+    cached = _generate(tmp_path, 1000, edit=5)
+
+    uncached = FlashCardGenerator().set_filename(tmp_path / "uncached.pdf").set_engine("canvas")
+    for i in range(1000):
+        uncached.add_entry("changed" if i == 5 else f"**word {i}**", f"woord {i}", "*extra*", str(i))
+    uncached.generate()
+
+    assert len(cached) == pytest.approx(len(uncached.filename.read_bytes()), rel=0.01)
+
+
+def test_prune_removes_least_recently_used(tmp_path: Path) -> None:
+    cache = PageCache(tmp_path, max_size=250)
+    for age, key in enumerate(["new", "old", "older"]):
+        cache.put(key, b"x" * 100)
+        os.utime(tmp_path / f"{key}.pdf", (1000 - age, 1000 - age))
+    assert cache.get("older") == b"x" * 100  # Using an entry makes it the most recent one
+
+    cache.prune()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["new.pdf", "older.pdf"]
+    assert cache.get("old") is None
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import pickle
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import pytest
+from reportlab import rl_config
+
+from flashcard_generator import FlashCard, FlashCardDeck, FlashCardGenerator
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+AMICUS = FlashCard("**amicus**", "de vriend", "*amici, m*", "1")
+DEUS = FlashCard("deus", "de god", "", "")
+
+
+def test_deck_reads_like_a_list_of_cards() -> None:
+    deck = FlashCardDeck([AMICUS, ("deus", "de god")])
+
+    assert len(deck) == 2
+    assert list(deck) == [AMICUS, DEUS]
+    assert deck[-1] == DEUS
+    assert deck[0:1] == [AMICUS]
+    assert deck[0].original == "<b>amicus</b>"
+    assert deck[0].front == AMICUS.front
+    assert deck[0].back == AMICUS.back
+    assert deck[1].front == DEUS.front
+    with pytest.raises(IndexError):
+        deck[2]
+
+
+def test_add_entries_from_a_deck() -> None:
+    fcg = FlashCardGenerator().add_entries(FlashCardDeck([AMICUS, DEUS]))
+
+    assert fcg.entries == [AMICUS, DEUS]
+    assert fcg.entries[0].front == AMICUS.front
+
+
+def test_deck_interns_fields() -> None:
+    deck = FlashCardDeck()
+    for index in range(100):
+        deck.add("**amicus**", "de vriend", "*amici, m*", str(index % 10))
+
+    assert len(deck) == 100
+    # amicus, de vriend, amici and the ten indices
+    assert len(deck._strings) == 13
+
+
+def test_deck_pickles() -> None:
+    deck = FlashCardDeck([AMICUS, DEUS])
+
+    copy = pickle.loads(pickle.dumps(deck))
+
+    assert list(copy) == [AMICUS, DEUS]
+    copy.add("deus", "de god")
+    assert len(copy._strings) == len(deck._strings)
+
+
+def _allocated(build: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        built = build()  # noqa: F841 - kept alive while measuring
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def test_deck_memory() -> None:
+    cards = [(f"**amicus {index}**", "de vriend", "*amici, m*", "") for index in range(2000)]
+
+    as_list = _allocated(lambda: [FlashCard(*card) for card in cards])
+    as_deck = _allocated(lambda: FlashCardDeck(cards))
+
+    assert as_deck * 3 < as_list
+
+
+@pytest.mark.parametrize("engine", ["platypus", "canvas"])
+def test_generate_deck(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, engine: str) -> None:
+    monkeypatch.setattr(rl_config, "invariant", 1)
+    cards = [(f"**amicus {index}**", "de vriend", "*amici, m*", str(index)) for index in range(30)]
+
+    listed = FlashCardGenerator().set_filename(tmp_path / "list.pdf").set_engine(engine).add_entries(cards)
+    listed.generate()
+    deck = FlashCardGenerator(entries=FlashCardDeck()).set_filename(tmp_path / "deck.pdf").set_engine(engine).add_entries(cards)
+    deck.generate()
+    streamed = FlashCardGenerator().set_filename(tmp_path / "stream.pdf").set_engine(engine)
+    streamed.generate_stream(FlashCardDeck(cards))
+
+    assert isinstance(deck.entries, FlashCardDeck)
+    output = listed.filename.read_bytes()
+    assert deck.filename.read_bytes() == output
+    assert streamed.filename.read_bytes() == output
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import random
+import re
+
+import pytest
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+from flashcard_generator.fitting import MIN_FONT_SIZE, fit_text, wrap_text
+from flashcard_generator.fonts import ensure_font
+from flashcard_generator.markup import Run, parse_markup
+
+_WORD_FONTS = {"<b>": "DejaVuSans-Bold", "<i>": "DejaVuSans-Oblique"}
+
+
+def _shrink_one_point_at_a_time(text: str, font_size: float, leading: float, max_height: float, max_width: float) -> tuple[float, list[str]]:
+    """The old fitting loop, with every word measured in its own font and without its tags, like ``simpleSplit`` otherwise."""
+
+    def width(word: str) -> float:
+        font_name = _WORD_FONTS.get(word[:3], "DejaVuSans")
+        ensure_font(font_name)
+        return stringWidth(re.sub(r"</?[biu]>", "", word), font_name, font_size)
+
+    def wrap() -> list[list[str]]:
+        wrapped: list[list[str]] = []
+        for line in text.split("<br/>"):
+            current: list[str] = []
+            line_width = 0.0
+            for word in line.split():
+                if current and line_width + stringWidth(" ", "DejaVuSans", font_size) + width(word) <= max_width:
+                    current.append(word)
+                    line_width += stringWidth(" ", "DejaVuSans", font_size) + width(word)
+                else:
+                    if current:
+                        wrapped.append(current)
+                    current, line_width = [word], width(word)
+            if current:
+                wrapped.append(current)
+        return wrapped
+
+    wrapped_lines = wrap()
+    while len(wrapped_lines) * leading > max_height and font_size > MIN_FONT_SIZE:
+        font_size -= 1
+        wrapped_lines = wrap()
+    return font_size, [re.sub(r"</?[biu]>", "", " ".join(line)) for line in wrapped_lines]
+
+
+def test_wrap_text() -> None:
+    assert wrap_text(parse_markup(""), "DejaVuSans", 10, 50) == ()
+    assert wrap_text(parse_markup("one<br/>two"), "DejaVuSans", 10, 500) == ((Run("one"),), (Run("two"),))
+    assert wrap_text(parse_markup("one two three"), "DejaVuSans", 10, 30) == ((Run("one"),), (Run("two"),), (Run("three"),))
+
+
+def test_markup_takes_no_room() -> None:
+    width = stringWidth("meester", "DejaVuSans-Bold", 10)
+
+    assert wrap_text(parse_markup("<b>meester</b> <b>meester</b>"), "DejaVuSans", 10, width) == ((Run("meester", bold=True),),) * 2
+    assert fit_text(parse_markup("<b>meester</b>"), "DejaVuSans", 10, 12, 12, width) == (10, ((Run("meester", bold=True),),))
+
+
+@pytest.mark.parametrize("font_size", [10, 8, 6.5, 6, 5])
+def test_fit_text_matches_shrinking_one_point_at_a_time(font_size: float) -> None:
+    rng = random.Random(font_size)
+    words = ["de", "het", "vriend", "<b>meester</b>", "<i>(bijwoord)</i>", "Romeinse", "senaatsgebouw", "toneelstuk,", "aandenken"]
+
+    for _ in range(300):
+        text = "<br/>".join(" ".join(rng.choices(words, k=rng.randint(0, 12))) for _ in range(rng.randint(1, 3)))
+        max_width = rng.uniform(30, 150)
+        max_height = rng.uniform(10, 60)
+
+        expected_size, expected_lines = _shrink_one_point_at_a_time(text, font_size, 12, max_height, max_width)
+        size, lines = fit_text(parse_markup(text), "DejaVuSans", font_size, 12, max_height, max_width)
+
+        assert size == expected_size
+        assert ["".join(run.text for run in line) for line in lines] == expected_lines
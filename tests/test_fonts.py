@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+from flashcard_generator import FlashCardGenerator, FontSet
+from flashcard_generator.fonts import DEFAULT_FONTS, ensure_font
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+VERA = ("Vera.ttf", "VeraBd.ttf", "VeraIt.ttf", "VeraBI.ttf")
+
+
+def test_import_does_not_load_fonts() -> None:
+    code = "import flashcard_generator.generator\nfrom reportlab.pdfbase import pdfmetrics\nprint('DejaVuSans' in pdfmetrics._fonts)"
+
+    assert subprocess.check_output([sys.executable, "-c", code], text=True).strip() == "False"
+
+
+def test_load_registers_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    registered = []
+    monkeypatch.setattr(pdfmetrics, "registerFont", registered.append)
+    fonts = FontSet("VeraOnce", *VERA)
+
+    fonts.load()
+    fonts.load()
+    ensure_font("VeraOnce-Bold")
+
+    assert [font.fontName for font in registered] == ["VeraOnce", "VeraOnce-Bold", "VeraOnce-Oblique", "VeraOnce-BoldOblique"]
+
+
+def test_font_set_without_files_keeps_the_default_fonts(monkeypatch: pytest.MonkeyPatch) -> None:
+    loaded = []
+    monkeypatch.setattr(FontSet, "load", lambda font_set: loaded.append(font_set))
+    FontSet("DejaVuSans")
+
+    ensure_font("DejaVuSans-Bold")
+
+    assert loaded == [DEFAULT_FONTS]
+
+
+def test_generate_with_custom_fonts(tmp_path: Path) -> None:
+    fcg = FlashCardGenerator().set_filename(tmp_path / "vera.pdf").set_fonts(FontSet("Vera", *VERA))
+    fcg.add_entry("**amicus**", "de vriend", "*amici, m*", "1").generate()
+
+    content = fcg.filename.read_bytes()
+    assert b"BitstreamVeraSans-Bold" in content
+    assert b"DejaVu" not in content
+
+
+def test_generate_with_preloaded_fonts(tmp_path: Path) -> None:
+    for name, filename in FontSet("VeraPreloaded", *VERA).files():
+        pdfmetrics.registerFont(TTFont(name, filename))
+
+    fcg = FlashCardGenerator().set_filename(tmp_path / "preloaded.pdf").set_fonts(FontSet("VeraPreloaded")).set_engine("canvas")
+    fcg.add_entry("*amicus*", "de vriend").generate()
+
+    assert b"BitstreamVeraSans-Oblique" in fcg.filename.read_bytes()
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from itertools import product
 from typing import TYPE_CHECKING
 
 import pytest
+from reportlab import rl_config
 from reportlab.lib.units import cm
 
-from flashcard_generator import FlashCard
+from flashcard_generator import FlashCard, FlashCardGenerator
 
 if TYPE_CHECKING:
-    from flashcard_generator import FlashCardGenerator
+    from pathlib import Path
 
 
 def test_format_markdown() -> None:
@@ -89,3 +93,76 @@ def test_no_padding_for_single_row(fcg: FlashCardGenerator, mock_place_on_page:
     fcg.generate()
 
     assert mock_place_on_page == [3, 3]  # Should not be padded, just one row of 3
+
+
+def test_padding_in_generate_stream(fcg: FlashCardGenerator, mock_place_on_page: list) -> None:
+    fcg.set_cards_per_row(5).generate_stream(FlashCard(f"Word{i}", f"Translation{i}") for i in range(1, 7))
+
+    assert mock_place_on_page == [5, 5]
+
+
+def test_no_padding_for_single_row_in_generate_stream(fcg: FlashCardGenerator, mock_place_on_page: list) -> None:
+    fcg.set_cards_per_row(5).generate_stream(FlashCard(f"Word{i}", f"Translation{i}") for i in range(1, 4))
+
+    assert mock_place_on_page == [3, 3]
+
+
+def test_generate_stream_matches_generate(fcg: FlashCardGenerator, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(rl_config, "invariant", 1)
+    entries = [(f"**Word{i}**", f"Translation{i} that is long enough to wrap", "*extra*", str(i)) for i in range(130)]
+
+    for entry in entries:
+        fcg.add_entry(*entry)
+    fcg.generate()
+
+    streamed = FlashCardGenerator().set_filename(tmp_path / "streamed.pdf")
+    streamed.generate_stream(FlashCard(*entry) for entry in entries)
+
+    assert streamed.filename.read_bytes() == fcg.filename.read_bytes()
+    assert streamed.entries == []
+
+
+def _deck(engine: str, cards: int) -> FlashCardGenerator:
+    fcg = FlashCardGenerator().set_engine(engine)
+    for i in range(cards):
+        fcg.add_entry(f"**Word{i}**", f"Translation{i} that is long enough to wrap", "*extra*", str(i))
+    return fcg
+
+
+@pytest.mark.parametrize("engine", ["platypus", "canvas"])
+def test_generate_to(fcg: FlashCardGenerator, monkeypatch: pytest.MonkeyPatch, engine: str) -> None:
+    monkeypatch.setattr(rl_config, "invariant", 1)
+    fcg.set_engine(engine)
+    for i in range(7):
+        fcg.add_entry(f"Word{i}", f"Translation{i}")
+    fcg.generate()
+
+    output = BytesIO()
+    stats = fcg.generate_to(output, stats=True)
+
+    assert output.getvalue() == fcg.filename.read_bytes() == fcg.generate_bytes()
+    assert stats is not None
+    assert stats.output_bytes == len(output.getvalue())
+    assert len(fcg.entries) == 7  # Padding leaves the entries alone
+
+
+@pytest.mark.parametrize("engine", ["platypus", "canvas"])
+def test_generate_on_threads(monkeypatch: pytest.MonkeyPatch, engine: str) -> None:
+    monkeypatch.setattr(rl_config, "invariant", 1)
+    generators = [_deck(engine, cards) for cards in (3, 30, 60, 130)] * 3
+    expected = [fcg.generate_bytes() for fcg in generators]
+
+    with ThreadPoolExecutor(8) as pool:
+        outputs = list(pool.map(FlashCardGenerator.generate_bytes, generators))
+
+    assert outputs == expected
+
+
+def test_generate_bytes_async(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(rl_config, "invariant", 1)
+    generators = [_deck("canvas", cards) for cards in (3, 30, 130)]
+
+    async def render() -> list[bytes]:
+        return await asyncio.gather(*(fcg.generate_bytes_async() for fcg in generators))
+
+    assert asyncio.run(render()) == [fcg.generate_bytes() for fcg in generators]
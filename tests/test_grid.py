@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import cm
+from reportlab.pdfgen.canvas import Canvas
+
+from flashcard_generator import FlashCardGenerator, grid
+from flashcard_generator.grid import GridGeometry
+from flashcard_generator.merge import parse_pdf
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _record_strings(monkeypatch: pytest.MonkeyPatch) -> list[tuple]:
+    drawn = []
+    draw_string = Canvas.drawString
+
+    def mock(self: Canvas, x: float, y: float, text: str, *args: object, **kwargs: object) -> None:
+        a, b, c, d, e, f = self._currentMatrix
+        drawn.append((round(a * x + c * y + e, 6), round(b * x + d * y + f, 6), text, self._fontname, self._fontsize))
+        draw_string(self, x, y, text, *args, **kwargs)
+
+    monkeypatch.setattr(Canvas, "drawString", mock)
+    return drawn
+
+
+def test_geometry_origin() -> None:
+    geometry = GridGeometry(A4, 100, 50, top_margin=10, bottom_margin=10, left_margin=20, right_margin=20)
+
+    x, y = geometry.origin(rows=2, cols=3)
+
+    assert x == pytest.approx(20 + 6 + (A4[0] - 40 - 12 - 300) / 2)
+    assert y == pytest.approx(A4[1] - 10 - 6 - 100)
+    assert geometry.content_size() == (88, 44)
+    assert geometry.rows_per_page() == int((A4[1] - 20 - 12) // 50)
+
+
+def test_geometry_rows_per_page() -> None:
+    assert GridGeometry(A4, 100, 2.3 * cm, 0.5 * cm, 0.5 * cm, 0, 0).rows_per_page() == 12
+    assert GridGeometry(A4, 100, 2.3 * cm, 3 * cm, 3 * cm, 0, 0).rows_per_page() == 10
+
+    with pytest.raises(ValueError, match="don't fit between the margins"):
+        GridGeometry(A4, 100, A4[1], 0.5 * cm, 0.5 * cm, 0, 0).rows_per_page()
+
+
+def test_unknown_engine(fcg: FlashCardGenerator) -> None:
+    with pytest.raises(ValueError, match="Unknown engine"):
+        fcg.set_engine("latex")
+
+
+@pytest.mark.parametrize("margin", [0.5 * cm, 3 * cm])
+@pytest.mark.parametrize("count", [3, 6, 130])
+def test_canvas_engine_matches_platypus(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, count: int, margin: float) -> None:
+    drawn = _record_strings(monkeypatch)
+    results = []
+
+    for engine in ("platypus", "canvas"):
+        fcg = FlashCardGenerator().set_filename(tmp_path / f"{engine}.pdf").set_engine(engine).set_cards_per_row(4).set_card_height(3 * cm)
+        fcg.set_margins(top=margin, bottom=margin)
+        for i in range(count):
+            fcg.add_entry(f"**Word{i}**", f"Translation{i} __that__ is long enough to wrap", "*extra*", str(i))
+        stats = fcg.generate(stats=True)
+
+        assert fcg.filename.exists()
+        assert all(y >= margin for _x, y, *_ in drawn)
+        results.append((stats.pages, list(drawn)))
+        drawn.clear()
+
+    assert results[0] == results[1]
+
+
+def _forms_deck(path: Path, *, forms: bool, workers: int = 1) -> bytes:
+    fcg = FlashCardGenerator().set_filename(path).set_engine("canvas").set_forms(enabled=forms).set_workers(workers, pages_per_chunk=1)
+    for i in range(130):
+        fcg.add_entry(f"amicus {i}", "de vriend, *de* __kameraad__", "", str(i))
+    fcg.generate()
+    return path.read_bytes()
+
+
+def test_forms(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    drawn = _record_strings(monkeypatch)
+    without_forms = _forms_deck(tmp_path / "without.pdf", forms=False)
+    texts_without = {text for _x, _y, text, _font, _size in drawn}
+    drawn.clear()
+    with_forms = _forms_deck(tmp_path / "with.pdf", forms=True)
+    texts_with = [text for _x, _y, text, _font, _size in drawn]
+
+    assert set(texts_with) == texts_without
+    # The back face is drawn as is until it has come back often enough, and then once more into its form
+    assert texts_with.count("de vriend, ") == grid.FORM_AFTER + 1
+    # A grid for the full pages, one for the last page and the back face
+    assert with_forms.count(b"/Subtype /Form") == 3
+    assert without_forms.count(b"/Subtype /Form") == 0
+    assert len(with_forms) < len(without_forms)
+
+
+def test_forms_parallel(tmp_path: Path) -> None:
+    serial = _forms_deck(tmp_path / "serial.pdf", forms=True)
+    parallel = _forms_deck(tmp_path / "parallel.pdf", forms=True, workers=2)
+
+    pages, _ = parse_pdf(parallel).page_tree()
+    assert len(pages) == 6
+    # Every chunk has forms of its own; the merge keeps one copy of those that are the same
+    assert parallel.count(b"/Subtype /Form") == serial.count(b"/Subtype /Form")
+
+
+def test_forms_need_canvas_engine(fcg: FlashCardGenerator) -> None:
+    fcg.set_forms().add_entry("amicus", "de vriend")
+
+    with pytest.raises(ValueError, match="canvas engine"):
+        fcg.generate()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from flashcard_generator import CardRange, FlashCard, FlashCardGenerator, IndexedSource, read_entries
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def csv_deck(tmp_path: Path) -> Path:
+    deck = tmp_path / "deck.csv"
+    rows = [f'{n % 3},word {n},"woord {n}",""' for n in range(300)]
+    rows[10] = '1,"**amicus**\nvriend",de vriend,"*amici, m*"'  # A quoted newline
+    rows[20] = ",,,"  # An empty row, which isn't a card
+    deck.write_text("index,original,translation,extra\n" + "\n".join(rows) + "\n", encoding="utf-8")
+    return deck
+
+
+@pytest.fixture
+def jsonl_deck(tmp_path: Path) -> Path:
+    deck = tmp_path / "deck.jsonl"
+    lines = [f'{{"original": "λόγος {n}", "translation": "woord {n}", "index": "{n % 3}"}}' for n in range(300)]
+    lines[5] = ""
+    deck.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return deck
+
+
+@pytest.mark.parametrize("deck", ["csv_deck", "jsonl_deck"])
+def test_random_access(deck: str, request: pytest.FixtureRequest) -> None:
+    filename = request.getfixturevalue(deck)
+    expected = list(read_entries(filename))
+
+    with IndexedSource(filename) as source:
+        assert len(source) == len(expected) == 299
+        assert list(source) == expected
+        assert [source[n] for n in (250, 9, 10, 0, -1)] == [expected[n] for n in (250, 9, 10, 0, -1)]
+        with pytest.raises(IndexError):
+            source[299]
+
+
+def test_slice(csv_deck: Path) -> None:
+    expected = list(read_entries(csv_deck))
+
+    with IndexedSource(csv_deck) as source:
+        cards = source[5:50]
+        assert isinstance(cards, CardRange)
+        assert len(cards) == 45
+        assert list(cards) == expected[5:50]
+        assert list(cards[::10]) == expected[5:50:10]
+        assert cards[5] == expected[10] == FlashCard("**amicus**\nvriend", "de vriend", "*amici, m*", "1")
+
+
+def test_where_index(jsonl_deck: Path) -> None:
+    expected = list(read_entries(jsonl_deck))
+
+    with IndexedSource(jsonl_deck) as source:
+        assert list(source.where_index("2")) == [card for card in expected if card.index == "2"]
+        assert list(source.where_index("0", "2")) == [card for card in expected if card.index != "1"]
+        assert len(source.where_index("3")) == 0
+
+
+def test_index_is_reused(csv_deck: Path) -> None:
+    IndexedSource(csv_deck).close()
+    index = csv_deck.with_name("deck.csv.idx")
+    modified = index.stat().st_mtime_ns
+    os.utime(index, ns=(modified - 10**9, modified - 10**9))
+
+    with IndexedSource(csv_deck) as source:
+        assert source[1] == FlashCard("word 1", "woord 1", "", "1")
+    assert index.stat().st_mtime_ns == modified - 10**9
+
+
+def test_index_is_rebuilt(csv_deck: Path) -> None:
+    IndexedSource(csv_deck).close()
+
+    csv_deck.write_text("original,translation\n**amicus**,de vriend\ndeus,de god\n", encoding="utf-8")
+    with IndexedSource(csv_deck) as source:
+        assert list(source) == [FlashCard("**amicus**", "de vriend"), FlashCard("deus", "de god")]
+
+    # Other options index other cards
+    with IndexedSource(csv_deck, header=False) as source:
+        assert source[0] == FlashCard("original", "translation")
+
+    csv_deck.with_name("deck.csv.idx").write_bytes(b"broken")
+    with IndexedSource(csv_deck) as source:
+        assert len(source) == 2
+
+
+def test_csv_with_byte_order_mark(tmp_path: Path) -> None:
+    deck = tmp_path / "deck.csv"
+    deck.write_text("original,translation\ndeus,de god\n", encoding="utf-8-sig")
+    assert IndexedSource(deck)[0] == FlashCard("deus", "de god", "", "")
+
+
+def test_unknown_format(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Unknown deck format"):
+        IndexedSource(tmp_path / "deck.txt")
+
+
+def test_generate_range(csv_deck: Path, tmp_path: Path) -> None:
+    with IndexedSource(csv_deck) as source:
+        cards = source[100:250]
+        from_range = FlashCardGenerator(entries=cards).set_engine("canvas").set_filename(tmp_path / "range.pdf").generate(stats=True)
+        from_list = FlashCardGenerator(entries=list(cards)).set_engine("canvas").set_filename(tmp_path / "list.pdf").generate(stats=True)
+
+    assert from_range is not None
+    assert from_list is not None
+    assert from_range.pages == from_list.pages == 6
+    assert (tmp_path / "range.pdf").stat().st_size == (tmp_path / "list.pdf").stat().st_size
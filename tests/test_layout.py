@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import pytest
+
+from flashcard_generator import FlashCard
+from flashcard_generator.fonts import DEFAULT_FONTS
+from flashcard_generator.layout import PlacedRun, draw_plan, fit_face, plan_face
+from flashcard_generator.markup import CardFace, parse_markup
+from flashcard_generator.measure import string_width
+
+WIDTH, HEIGHT = 101.4, 59.2
+
+
+class RecordingCanvas:
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+
+    def setFont(self, *args: object) -> None:
+        self.calls.append(("setFont", *args))
+
+    def drawString(self, *args: object) -> None:
+        self.calls.append(("drawString", *args))
+
+    def line(self, *args: object) -> None:
+        self.calls.append(("line", *args))
+
+
+@pytest.fixture(autouse=True)
+def _fonts() -> None:
+    DEFAULT_FONTS.load()
+
+
+def _plan(face: CardFace) -> object:
+    return plan_face(face, "DejaVuSans", 10, 12, WIDTH, HEIGHT)
+
+
+def test_plan_face() -> None:
+    plan = _plan(FlashCard("<u>amicus</u> <b>x</b>", "de vriend", "extra", "7").front)
+
+    main_width = string_width("amicus ", "DejaVuSans", 10) + string_width("x", "DejaVuSans-Bold", 10)
+    extra_width = string_width("extra", "DejaVuSans", 8)
+    assert plan.runs == (
+        PlacedRun("DejaVuSans", 10, (WIDTH - main_width) / 2, HEIGHT / 2, "amicus", string_width("amicus", "DejaVuSans", 10)),
+        PlacedRun("DejaVuSans", 10, (WIDTH - main_width) / 2 + string_width("amicus", "DejaVuSans", 10), HEIGHT / 2, " "),
+        PlacedRun("DejaVuSans-Bold", 10, (WIDTH - main_width) / 2 + string_width("amicus ", "DejaVuSans", 10), HEIGHT / 2, "x"),
+        PlacedRun("DejaVuSans", 8, (WIDTH - extra_width) / 2, 17, "extra"),
+        PlacedRun("DejaVuSans", 6, WIDTH - 2 - string_width("7", "DejaVuSans", 6), 2, "7"),
+    )
+    assert plan.body == plan.runs[:-1]
+    assert plan.index == plan.runs[-1:]
+    assert plan.texts == (plan.main, plan.extra)
+    assert fit_face(FlashCard("<u>amicus</u> <b>x</b>", "de vriend", "extra", "7").front, "DejaVuSans", 10, 12, WIDTH, HEIGHT) == plan.texts
+    assert plan.main.font_size == 10
+    assert not plan.main.shrunk
+    assert not plan.main.overflowing
+
+
+def test_plan_face_fitting() -> None:
+    shrunk = _plan(CardFace(parse_markup(" ".join(["shrinks"] * 6))))
+    overflowing = _plan(CardFace(parse_markup(" ".join(["overflows"] * 40))))
+
+    assert shrunk.main.shrunk
+    assert not shrunk.main.overflowing
+    assert overflowing.main.font_size == 6
+    assert overflowing.main.overflowing
+    assert overflowing.extra is None
+
+
+def test_identical_faces_share_their_plan() -> None:
+    deus = FlashCard("deus", "de god", "*(bijwoord)*")
+
+    assert _plan(deus.front) is _plan(FlashCard("deus", "de god", "*(bijwoord)*").front)
+    assert _plan(FlashCard("de god", "deus").front) is _plan(deus.back)  # Plans carry over from front to back
+    assert _plan(FlashCard("", "").front) is _plan(FlashCard("", "").back)
+
+
+def test_faces_share_their_body_whatever_the_index() -> None:
+    first, second = _plan(FlashCard("deus", "de god", "", "1").front), _plan(FlashCard("deus", "de god", "", "2").front)
+
+    assert first.body == second.body
+    assert all(a is b for a, b in zip(first.body, second.body))  # noqa: B905
+    assert first.main is second.main
+    assert first.index != second.index
+    assert fit_face(FlashCard("deus", "de god", "", "1").front, "DejaVuSans", 10, 12, WIDTH, HEIGHT) is fit_face(
+        FlashCard("deus", "de god", "", "2").front, "DejaVuSans", 10, 12, WIDTH, HEIGHT
+    )
+
+
+def test_draw_plan() -> None:
+    canvas = RecordingCanvas()
+
+    draw_plan(canvas, _plan(FlashCard("<u>a</u> b", "").front), 100, 200)
+
+    width = string_width("a", "DejaVuSans", 10)
+    x = 100 + (WIDTH - string_width("a b", "DejaVuSans", 10)) / 2
+    y = 200 + HEIGHT / 2
+    assert canvas.calls == [
+        ("setFont", "DejaVuSans", 10),  # Only set once for the whole line
+        ("drawString", x, y, "a"),
+        ("line", x, y - 2, x + width, y - 2),
+        ("drawString", pytest.approx(x + width), y, " b"),
+    ]
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from flashcard_generator import FlashCard, FlashCardGenerator, read_csv, read_entries, read_jsonl, read_tsv
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+AMICUS = FlashCard("**amicus**", "de vriend", "*amici, m*", "1")
+DEUS = FlashCard("deus", "de god", "", "")
+
+
+def test_read_csv(tmp_path: Path) -> None:
+    deck = tmp_path / "deck.csv"
+    deck.write_text('index,original,translation,extra\n1,**amicus**,de vriend,"*amici, m*"\n\n,deus,de god\n', encoding="utf-8")
+
+    assert list(read_csv(deck)) == [AMICUS, DEUS]
+
+
+def test_read_csv_columns(tmp_path: Path) -> None:
+    deck = tmp_path / "deck.csv"
+    deck.write_text("latin,dutch\n**amicus**,de vriend\n", encoding="utf-8")
+    assert list(read_csv(deck, columns={"original": "latin", "translation": "dutch"})) == [FlashCard("**amicus**", "de vriend")]
+
+    deck.write_text("de vriend;**amicus**\n", encoding="utf-8")
+    assert list(read_csv(deck, delimiter=";", header=False, columns={"original": 1, "translation": 0})) == [FlashCard("**amicus**", "de vriend")]
+
+
+@pytest.mark.parametrize(
+    ("content", "options", "message"),
+    [
+        ("latin,dutch\n", {}, "No column for the original"),
+        ("a,b\n", {"columns": {"original": 0, "translation": 1, "notes": 2}}, "Unknown card field"),
+        ("a,b\n", {"header": False, "columns": {"original": "a", "translation": 1}}, "only be looked up in a file with a header"),
+    ],
+)
+def test_read_csv_errors(tmp_path: Path, content: str, options: dict, message: str) -> None:
+    deck = tmp_path / "deck.csv"
+    deck.write_text(content, encoding="utf-8")
+
+    with pytest.raises(ValueError, match=message):
+        list(read_csv(deck, **options))
+
+
+def test_read_csv_with_byte_order_mark(tmp_path: Path) -> None:
+    deck = tmp_path / "deck.csv"
+    deck.write_text("original,translation\ndeus,de god\n", encoding="utf-8-sig")
+    assert list(read_csv(deck)) == [DEUS]
+
+
+def test_read_tsv(tmp_path: Path) -> None:
+    deck = tmp_path / "deck.tsv"
+    deck.write_text("**amicus**\tde vriend\t*amici, m*\t1\n", encoding="utf-8")
+
+    assert list(read_tsv(deck, header=False)) == [AMICUS]
+
+
+def test_read_jsonl(tmp_path: Path) -> None:
+    deck = tmp_path / "deck.jsonl"
+    deck.write_text(
+        '{"original": "**amicus**", "translation": "de vriend", "extra": "*amici, m*", "index": 1}\n\n["deus", "de god"]\n',
+        encoding="utf-8",
+    )
+    assert list(read_jsonl(deck)) == [AMICUS, DEUS]
+
+    deck.write_text('{"la": "deus", "nl": "de god"}\n', encoding="utf-8")
+    assert list(read_jsonl(deck, keys={"original": "la", "translation": "nl"})) == [DEUS]
+
+    with pytest.raises(ValueError, match=r"Line 1 of .* has no original"):
+        list(read_jsonl(deck))
+
+    deck.write_text('{"original": "deus", "translation": "de god", "extra": null, "index": null}\n[null, "de god"]\n', encoding="utf-8")
+    assert list(read_jsonl(deck)) == [DEUS, FlashCard("", "de god", "", "")]
+
+    deck.write_text('["deus"]\n', encoding="utf-8")
+    with pytest.raises(ValueError, match=r"Line 1 of .* has 1 field\(s\), expected at least 2"):
+        list(read_jsonl(deck))
+
+    deck.write_text('"deus"\n', encoding="utf-8")
+    with pytest.raises(TypeError, match="not a JSON object or array"):
+        list(read_jsonl(deck))
+
+
+def test_read_entries(tmp_path: Path) -> None:
+    (tmp_path / "deck.jsonl").write_text('["deus", "de god"]\n', encoding="utf-8")
+    (tmp_path / "deck.tsv").write_text("original\ttranslation\ndeus\tde god\n", encoding="utf-8")
+
+    assert list(read_entries(tmp_path / "deck.jsonl")) == [DEUS]
+    assert list(read_entries(tmp_path / "deck.tsv")) == [DEUS]
+    with pytest.raises(ValueError, match=r"Unknown deck format '\.txt'"):
+        read_entries(tmp_path / "deck.txt")
+
+
+def test_add_entries(fcg: FlashCardGenerator) -> None:
+    fcg.add_entries([AMICUS, ("deus", "de god"), ["pater", "de vader", "*patr-is, m*"]])
+
+    assert fcg.entries == [AMICUS, DEUS, FlashCard("pater", "de vader", "*patr-is, m*")]
+
+
+def test_loaders_stream_into_generate_stream(tmp_path: Path) -> None:
+    deck = tmp_path / "deck.csv"
+    deck.write_text("original,translation\n" + "".join(f"word {i},woord {i}\n" for i in range(130)), encoding="utf-8")
+
+    in_memory = FlashCardGenerator().set_filename(tmp_path / "in_memory.pdf").add_entries(read_csv(deck))
+    in_memory.generate()
+    FlashCardGenerator().set_filename(tmp_path / "streamed.pdf").generate_stream(read_csv(deck))
+
+    assert len(in_memory.entries) == 130
+    assert (tmp_path / "streamed.pdf").stat().st_size > 0
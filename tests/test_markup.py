@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from flashcard_generator import FlashCard
+from flashcard_generator.markup import CardFace, Run, font_for, parse_markup
+
+
+def test_parse_markup() -> None:
+    assert parse_markup("") == ((),)
+    assert parse_markup("plain") == ((Run("plain"),),)
+    assert parse_markup("<b>bold</b> and <i>italic</i>") == ((Run("bold", bold=True), Run(" and "), Run("italic", italic=True)),)
+    assert parse_markup("<b><i>both</i></b>") == ((Run("both", bold=True, italic=True),),)
+    assert parse_markup("<u>under<br/>line</u>") == ((Run("under", underline=True),), (Run("line", underline=True),))
+    assert parse_markup("one\ntwo") == ((Run("one"),), (Run("two"),))
+    assert parse_markup("<font size=8>unknown</font>") == ((Run("unknown"),),)
+
+
+def test_parse_markup_is_shared() -> None:
+    assert parse_markup("*(bijwoord)*") is parse_markup("*(bijwoord)*")
+
+
+def test_font_for() -> None:
+    assert font_for("DejaVuSans", Run("x")) == "DejaVuSans"
+    assert font_for("DejaVuSans", Run("x", bold=True)) == "DejaVuSans-Bold"
+    assert font_for("DejaVuSans", Run("x", italic=True, underline=True)) == "DejaVuSans-Oblique"
+    assert font_for("DejaVuSans", Run("x", bold=True, italic=True)) == "DejaVuSans-BoldOblique"
+
+
+def test_flashcard_faces() -> None:
+    card = FlashCard("**amicus**", "de vriend", "*amici, m*", "1")
+
+    assert card.front == CardFace(((Run("amicus", bold=True),),), ((Run("amici, m", italic=True),),), ((Run("1"),),))
+    assert card.back == CardFace(((Run("de vriend"),),), (), ((Run("1"),),))
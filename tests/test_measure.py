@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+from flashcard_generator import measure
+from flashcard_generator.markup import Run, parse_markup
+
+
+@pytest.mark.parametrize("font_name", ["DejaVuSans", "DejaVuSans-Bold", "DejaVuSans-Oblique", "Helvetica"])
+@pytest.mark.parametrize("text", ["", " ", "(bijwoord)", "het gezin, het personeel", "ĳsbeer — œuvre ∑"])
+def test_string_width_matches_reportlab(font_name: str, text: str) -> None:
+    assert measure.string_width(text, font_name, 7.5) == stringWidth(text, font_name, 7.5)
+
+
+def test_string_width_is_memoized() -> None:
+    measure.string_width.cache_clear()
+
+    measure.string_width("(voegwoord)", "DejaVuSans", 8)
+    measure.string_width("(voegwoord)", "DejaVuSans", 8)
+    measure.string_width("(voegwoord)", "DejaVuSans", 10)
+
+    info = measure.string_width.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+def test_line_width() -> None:
+    line = (Run("de "), Run("vriend", bold=True))
+
+    assert measure.line_width(line, "DejaVuSans", 10) == stringWidth("de ", "DejaVuSans", 10) + stringWidth("vriend", "DejaVuSans-Bold", 10)
+
+
+def test_split_line_keeps_styles() -> None:
+    (line,) = parse_markup("<u>de vriend</u> en <b>de <i>meester</i></b>")
+
+    assert measure.split_line(line, "DejaVuSans", 10, 1000) == [
+        (Run("de vriend", underline=True), Run(" en "), Run("de ", bold=True), Run("meester", bold=True, italic=True)),
+    ]
+    assert measure.split_line(line, "DejaVuSans", 10, 60) == [
+        (Run("de vriend", underline=True),),
+        (Run("en "), Run("de", bold=True)),
+        (Run("meester", bold=True, italic=True),),
+    ]
+
+
+def test_split_line_matches_simple_split() -> None:
+    rng = random.Random(4)
+    words = ["de", "het", "vriend", "meester", "(bijwoord)", "Romeinse", "senaatsgebouw", "toneelstuk,", "  "]
+
+    for _ in range(300):
+        text = " ".join(rng.choices(words, k=rng.randint(0, 15)))
+        max_width = rng.uniform(20, 200)
+        lines = measure.split_line((Run(text),), "DejaVuSans", 10, max_width)
+
+        assert ["".join(run.text for run in line) for line in lines] == simpleSplit(text, "DejaVuSans", 10, max_width)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import base64
+import re
+import zlib
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+import pytest
+from reportlab import rl_config
+
+from flashcard_generator import FlashCard, FlashCardGenerator
+from flashcard_generator.merge import PdfMerger, merge_pdfs, parse_pdf
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _generate(path: Path, cards: int, original: str = "**amicus**", **options: int) -> bytes:
+    fcg = FlashCardGenerator().set_filename(path).set_engine("canvas")
+    if options:
+        fcg.set_workers(**options)
+    for _ in range(cards):
+        fcg.add_entry(original, "de vriend", "*amici, m*", "1")
+    fcg.generate()
+    return path.read_bytes()
+
+
+def _page_contents(document: bytes) -> list[bytes]:
+    pdf = parse_pdf(document)
+    pages, _ = pdf.page_tree()
+    contents = []
+    for page in pages:
+        number = int(re.search(rb"/Contents (\d+) 0 R", pdf.objects[page][0])[1])
+        head, stream = pdf.objects[number]
+        start = stream.index(b"\n") + 1
+        stream = stream[start : start + int(re.search(rb"/Length (\d+)", head)[1])]
+        if b"/ASCII85Decode" in head:
+            stream = base64.a85decode(stream, adobe=True)
+        contents.append(zlib.decompress(stream) if b"/FlateDecode" in head else stream)
+    return contents
+
+
+def test_parse_pdf(tmp_path: Path) -> None:
+    pdf = parse_pdf(_generate(tmp_path / "deck.pdf", 130))
+
+    pages, nodes = pdf.page_tree()
+    assert len(pages) == 6
+    assert len(nodes) == 1
+
+
+def test_parse_pdf_rejects_other_files() -> None:
+    with pytest.raises(ValueError, match="Not a PDF document"):
+        parse_pdf(b"amicus")
+
+
+def test_merge_pdfs(tmp_path: Path) -> None:
+    first = _generate(tmp_path / "first.pdf", 130)
+    second = _generate(tmp_path / "second.pdf", 3, "**θεός**")
+
+    output = BytesIO()
+    merge_pdfs([first, second], output)
+
+    merged = output.getvalue()
+    assert _page_contents(merged) == _page_contents(first) + _page_contents(second)
+    # Only the bold subset differs; the other fonts are shared, and different subsets must keep a name of their own
+    assert sorted(re.findall(rb"/BaseFont /([A-Z]{6}\+\S+)", merged)) == [
+        b"AAAAAA+DejaVuSans",
+        b"AAAAAA+DejaVuSans-Bold",
+        b"AAAAAA+DejaVuSans-Oblique",
+        b"AAAAAB+DejaVuSans-Bold",
+    ]
+
+
+def test_merge_selected_pages_shares_objects(tmp_path: Path) -> None:
+    document = _generate(tmp_path / "deck.pdf", 130)
+
+    whole = BytesIO()
+    merge_pdfs([document], whole)
+    pieces = BytesIO()
+    merger = PdfMerger(pieces)
+    for pages in ([4, 5], [0, 1], [2, 3]):
+        merger.add(document, pages)
+    merger.close()
+
+    contents = _page_contents(document)
+    assert _page_contents(pieces.getvalue()) == contents[4:] + contents[:4]
+    # The fonts are written only once
+    assert len(re.findall(rb"/FontFile2", pieces.getvalue())) == len(re.findall(rb"/FontFile2", document)) == 3
+    assert abs(len(pieces.getvalue()) - len(whole.getvalue())) < 100
+
+
+@pytest.mark.parametrize(("count", "pages_per_chunk"), [(3, 1), (130, 1), (130, 50), (1000, 3)])
+def test_parallel_matches_serial(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, count: int, pages_per_chunk: int) -> None:
+    monkeypatch.setattr(rl_config, "invariant", 1)
+
+    serial = _generate(tmp_path / "serial.pdf", count)
+    parallel = _generate(tmp_path / "parallel.pdf", count, count=2, pages_per_chunk=pages_per_chunk)
+
+    assert _page_contents(parallel) == _page_contents(serial)
+
+
+@pytest.mark.parametrize("engine", ["platypus", "canvas"])
+def test_stream_in_chunks_matches_generate(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, engine: str) -> None:
+    monkeypatch.setattr(rl_config, "invariant", 1)
+    cards = [FlashCard(f"**amicus {i}**", "de vriend", "*amici, m*", str(i)) for i in range(130)]
+
+    whole = FlashCardGenerator(entries=cards).set_filename(tmp_path / "whole.pdf").set_engine(engine)
+    whole.generate()
+    streamed = FlashCardGenerator().set_filename(tmp_path / "streamed.pdf").set_engine(engine).set_workers(1, pages_per_chunk=1)
+    stats = streamed.generate_stream(iter(cards), stats=True)
+
+    assert stats is not None
+    assert stats.pages == 6
+    assert stats.output_bytes == streamed.filename.stat().st_size
+    assert _page_contents(streamed.filename.read_bytes()) == _page_contents(whole.filename.read_bytes())
+
+
+@pytest.mark.parametrize("engine", ["platypus", "canvas"])
+def test_profiles(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, engine: str) -> None:
+    monkeypatch.setattr(rl_config, "invariant", 1)
+    outputs = {}
+    for profile in ("default", "fast", "compact"):
+        fcg = FlashCardGenerator().set_filename(tmp_path / f"{profile}.pdf").set_engine(engine).set_profile(profile)
+        for i in range(60):
+            fcg.add_entry(f"**amicus {i}**", "de vriend", "*amici, m*", str(i))
+        stats = fcg.generate(stats=True)
+        outputs[profile] = fcg.filename.read_bytes()
+        assert stats is not None
+        assert stats.output_bytes == len(outputs[profile])
+
+    assert _page_contents(outputs["fast"]) == _page_contents(outputs["compact"]) == _page_contents(outputs["default"])
+    assert b"/FlateDecode" not in outputs["fast"]
+    assert b"/ASCII85Decode" not in outputs["compact"]
+    assert len(outputs["fast"]) > len(outputs["default"]) > len(outputs["compact"])
+
+
+def test_compact_parallel(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(rl_config, "invariant", 1)
+    serial = _generate(tmp_path / "serial.pdf", 130)
+    parallel = FlashCardGenerator().set_filename(tmp_path / "parallel.pdf").set_engine("canvas").set_profile("compact").set_workers(2, pages_per_chunk=1)
+    for _ in range(130):
+        parallel.add_entry("**amicus**", "de vriend", "*amici, m*", "1")
+    parallel.generate()
+
+    compact = parallel.filename.read_bytes()
+    assert _page_contents(compact) == _page_contents(serial)
+    assert b"/ASCII85Decode" not in compact
+    assert len(compact) < len(serial)
+
+
+def test_unknown_profile() -> None:
+    with pytest.raises(ValueError, match="Unknown profile"):
+        FlashCardGenerator().set_profile("tiny")
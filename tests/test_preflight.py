@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from reportlab.lib.units import cm
+
+from flashcard_generator import FlashCard, FlashCardDeck, FlashCardGenerator
+from flashcard_generator.fitting import MIN_FONT_SIZE
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+LONG = " ".join(["overflows"] * 40)
+
+
+@pytest.fixture
+def fcg(tmp_path: Path) -> FlashCardGenerator:
+    fcg = FlashCardGenerator().set_filename(tmp_path / "deck.pdf")
+    for i in range(130):
+        fcg.add_entry(f"amicus {i}", "de vriend", "*amici, m*", str(i))
+    fcg.add_entry("deus", " ".join(["shrinks"] * 6), index="130")
+    fcg.add_entry(LONG, "de god", index="131")
+    return fcg
+
+
+def test_preflight(fcg: FlashCardGenerator) -> None:
+    report = fcg.preflight()
+
+    assert len(report.cards) == 132  # Without the padding
+    assert report.pages == 6
+    assert report.pages == fcg.generate(stats=True).pages
+    assert [card.position for card in report.cards] == list(range(132))
+    assert report.cards[0].page == 1
+    assert report.cards[-1].page == 5
+
+    amicus, shrunk, overflowing = report.cards[0], report.cards[130], report.cards[131]
+    assert amicus.card == FlashCard("amicus 0", "de vriend", "*amici, m*", "0")
+    assert (amicus.front.font_size, amicus.extra.font_size, amicus.back.font_size) == (10, 8, 10)
+    assert not amicus.shrunk
+    assert shrunk.shrunk
+    assert not shrunk.overflowing
+    assert shrunk.extra is None
+    assert overflowing.overflowing
+    assert overflowing.front.font_size == MIN_FONT_SIZE
+
+    assert report.shrunk == [shrunk, overflowing]
+    assert report.overflowing == [overflowing]
+    assert not report.ok
+    assert report.summary() == f"132 cards on 6 pages: 2 shrunk, 1 overflowing\ncard 132 (index 131) on page 5: front overflowing: {LONG!r}"
+
+
+@pytest.mark.parametrize("engine", ["platypus", "canvas"])
+def test_preflight_with_margins(fcg: FlashCardGenerator, engine: str) -> None:
+    fcg.set_engine(engine).set_margins(top=8 * cm, bottom=8 * cm)  # Leaves room for 5 rows
+
+    report = fcg.preflight()
+
+    assert report.pages == 12
+    assert report.pages == fcg.generate(stats=True).pages
+    assert report.cards[-1].page == 11
+
+
+def test_preflight_entries(fcg: FlashCardGenerator) -> None:
+    report = fcg.preflight(FlashCardDeck([("amicus", "de vriend"), ("deus", "de god")]))
+
+    assert len(report.cards) == 2
+    assert report.pages == 2
+    assert report.ok
+    assert report.summary() == "2 cards on 2 pages: 0 shrunk, 0 overflowing"
+    assert len(fcg.entries) == 132
+
+
+def test_preflight_draws_nothing(fcg: FlashCardGenerator, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(FlashCardGenerator, "_render", pytest.fail)
+
+    assert fcg.preflight().pages == 6
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from flashcard_generator import FlashCardGenerator, GenerationStats
+from flashcard_generator import stats as stats_module
+from flashcard_generator.stats import PHASES, collecting, phase, timed
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _deck(tmp_path: Path, engine: str, tag: str) -> FlashCardGenerator:
+    fcg = FlashCardGenerator().set_filename(tmp_path / f"{engine}.pdf").set_engine(engine)
+    fcg.add_entry(f"{tag} fits", "past", "*extra*", "1")
+    fcg.add_entry(" ".join([f"{tag}shrinks"] * 6), "past")
+    fcg.add_entry(" ".join([f"{tag}overflows"] * 40), "past")
+    return fcg
+
+
+def test_stats_are_off_by_default(tmp_path: Path) -> None:
+    assert _deck(tmp_path, "canvas", "off").generate() is None
+
+
+@pytest.mark.parametrize("engine", ["platypus", "canvas"])
+def test_generate_stats(tmp_path: Path, engine: str) -> None:
+    fcg = _deck(tmp_path, engine, engine[0])  # A tag of its own, so the texts haven't been fitted before
+
+    stats = fcg.generate(stats=True)
+
+    assert set(stats.seconds) == set(PHASES)
+    assert stats.seconds["draw"] > 0
+    assert stats.total_seconds == pytest.approx(sum(stats.seconds.values()))
+    assert stats.texts_fitted == 7  # Three cards on both sides, one extra
+    assert stats.texts_shrunk == 2
+    assert stats.texts_overflowing == 1
+    assert stats.fit_attempts > stats.texts_fitted  # Shrinking takes more than one attempt (the first time)
+    assert stats.pages == 2
+    assert stats.output_bytes == fcg.filename.stat().st_size
+
+
+@pytest.mark.parametrize("option", ["workers", "cache"])
+def test_stats_add_up_over_chunks(tmp_path: Path, option: str) -> None:
+    fcg = FlashCardGenerator().set_filename(tmp_path / "deck.pdf").set_engine("canvas")
+    if option == "workers":
+        fcg.set_workers(2, pages_per_chunk=1)
+    else:
+        fcg.set_cache(tmp_path / "cache")
+
+    cards = _deck(tmp_path, "canvas", option).entries * 50
+    stats = fcg.generate_stream((replace(card, index=str(i)) for i, card in enumerate(cards)), stats=True)
+
+    assert stats.texts_fitted == 350
+    assert stats.pages == 6
+    assert stats.output_bytes == fcg.filename.stat().st_size
+
+
+def test_phases_leave_out_nested_phases(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = iter([0.0, 1.0, 3.0, 4.0, 10.0, 11.0, 12.0, 20.0])
+    monkeypatch.setattr(stats_module.time, "perf_counter", lambda: next(clock))
+    stats = GenerationStats()
+
+    with collecting(stats), phase("write"):  # 0 .. 20
+        with phase("draw"):  # 1 .. 3
+            pass
+        assert list(timed("read", [1])) == [1]  # 4 .. 10 for the item, 11 .. 12 to find there are no more
+
+    assert stats.seconds == {"read": 7.0, "layout": 0.0, "fit": 0.0, "draw": 2.0, "write": 11.0}